@@ -4,36 +4,30 @@ Built on Coptic SCRIPTORIUM and Stanford NLP tools
 """
 
 import gradio as gr
+import gc
+import html
+import os
 import stanza
+from stanza.models.common.doc import Document
 import torch
+import torch.nn as nn
+from torch.ao.quantization import quantize_dynamic
+import queue
 import sys
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from collections import OrderedDict
 from pathlib import Path
+from string import Template
 import warnings
 warnings.filterwarnings('ignore')
 
-# Fix PyTorch 2.6+ compatibility and __getitems__ error
-import pickle
-
-# Store original torch.load
-_original_torch_load = torch.load
-
-def patched_torch_load(*args, **kwargs):
-    """Patched torch.load with multiple compatibility fixes"""
-    # Set weights_only=False for older models
-    kwargs['weights_only'] = False
-
-    try:
-        return _original_torch_load(*args, **kwargs)
-    except (KeyError, AttributeError) as e:
-        if '__getitems__' in str(e) or '__getitem__' in str(e):
-            # Try with pickle protocol 4
-            print(f"Retrying model load with pickle protocol 4...")
-            kwargs['pickle_module'] = pickle
-            return _original_torch_load(*args, **kwargs)
-        raise
-
-# Apply the patch
-torch.load = patched_torch_load
+try:
+    from safetensors.torch import load_file, save_file
+except ImportError:
+    load_file = save_file = None
 
 # Import diaparser
 sys.path.insert(0, str(Path(__file__).parent))
@@ -43,101 +37,497 @@ from diaparser.parsers.parser import Parser
 from diaparser.utils.data import Dataset
 from diaparser.utils.transform import Sentence
 
-# Patch Dataset to handle __getitems__ check
-original_dataset_getattr = Dataset.__getattr__
+# Their __getattr__ forwards unknown names to the sentences, so DataLoader's
+# hasattr(dataset, '__getitems__') check used to succeed with a bogus value.
+# Class attributes are found before __getattr__ runs; a falsy __getitems__
+# makes DataLoader fall back to per-index dataset[i] fetching.
+for cls in (Dataset, Sentence):
+    for name, value in (('__getitems__', None), ('_is_protocol', False)):
+        if not hasattr(cls, name):
+            setattr(cls, name, value)
+
+# Run both models on the GPU when one is visible. Grad mode is per thread,
+# so the model-calling functions below disable autograd with
+# @torch.inference_mode() in whichever thread runs them.
+DEVICE = 'cuda' if torch.cuda.is_available() else 'cpu'
+
+# Sentence lengths vary per request, so cuDNN autotuning would keep re-benchmarking
+torch.backends.cudnn.benchmark = False
+torch.backends.cudnn.deterministic = True
+
+# On CPU use every core for intra-op work and avoid inter-op oversubscription
+if DEVICE == 'cpu':
+    torch.set_num_threads(os.cpu_count() or 1)
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        pass  # Already fixed once parallel work has started
+
+# oneDNN kernels for CPU matmuls; TF32 on GPU / reduced-precision CPU matmuls
+torch.backends.mkldnn.enabled = True
+torch.set_float32_matmul_precision('high')
 
-def patched_dataset_getattr(self, name):
-    """Patched __getattr__ to handle PyTorch DataLoader checks"""
-    if name in ('__getitems__', '__getitem__', '_is_protocol'):
-        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
-    return original_dataset_getattr(self, name)
 
-Dataset.__getattr__ = patched_dataset_getattr
+def _cpu_supports_bf16():
+    """True when oneDNN reports native bfloat16 support (AVX512-BF16/AMX)"""
+    try:
+        return bool(torch.ops.mkldnn._is_mkldnn_bf16_supported())
+    except (AttributeError, RuntimeError):
+        return False
 
-# Patch Sentence to handle __getitems__ check
-original_sentence_getattr = Sentence.__getattr__
 
-def patched_sentence_getattr(self, name):
-    """Patched __getattr__ to handle PyTorch DataLoader checks"""
-    if name in ('__getitems__', '__getitem__', '_is_protocol'):
-        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
-    return original_sentence_getattr(self, name)
+# Dynamically quantize DiaParser's Linear/LSTM layers to int8 on CPU (COPTIC_QUANTIZE=0 disables)
+QUANTIZE = DEVICE == 'cpu' and os.environ.get('COPTIC_QUANTIZE', '1') != '0'
 
-Sentence.__getattr__ = patched_sentence_getattr
+# Run DiaParser under bfloat16 autocast on CPUs with native bf16 (COPTIC_CPU_BF16=0 disables).
+# Quantized layers expect float32 input, so this only applies to unquantized models.
+CPU_BF16 = (
+    DEVICE == 'cpu'
+    and not QUANTIZE
+    and os.environ.get('COPTIC_CPU_BF16', '1') != '0'
+    and torch.backends.mkldnn.is_available()
+    and _cpu_supports_bf16()
+)
 
 # Global variables for models
 nlp = None
+nlp_pretok = None
 diaparser = None
 prolog = None
 
+# Set once load_models has run; the lock keeps concurrent first requests
+# from loading the models twice
+_loaded = False
+_load_lock = threading.Lock()
+
+# COPTIC_PROLOG_DEBUG=1 validates through live Prolog queries instead of
+# the rule tables compiled from Prolog at load time
+PROLOG_DEBUG = os.environ.get('COPTIC_PROLOG_DEBUG', '0') == '1'
+_prolog_lock = threading.Lock()
+
+# With live Prolog queries (COPTIC_PROLOG_DEBUG=1), only sentences with a
+# tripartite copula are validated; COPTIC_PROLOG_ALL=1 validates every one
+PROLOG_ALL_SENTENCES = os.environ.get('COPTIC_PROLOG_ALL', '0') == '1'
+try:
+    from coptic_prolog_rules import COPULAS
+except ImportError:
+    COPULAS = frozenset()  # No Prolog binding; _load_prolog reports it
+
+# Stanza settings shared by the full and pretokenized pipelines
+STANZA_KWARGS = {
+    'lang': 'cop',
+    'processors': 'tokenize,pos',
+    'tokenize_batch_size': 64,
+    'use_gpu': DEVICE == 'cuda',
+    'verbose': False
+}
+
+# DiaParser converted on first start: tensors in safetensors, plus a small
+# torch.save skeleton holding the parser class, args and vocabularies
+DIAPARSER_SOURCE = 'cop.diaparser'
+DIAPARSER_CACHE_DIR = Path.home() / '.cache' / 'coptic'
+DIAPARSER_WEIGHTS = DIAPARSER_CACHE_DIR / 'cop.diaparser.safetensors'
+DIAPARSER_SKELETON = DIAPARSER_CACHE_DIR / 'cop.diaparser.skeleton.pt'
+
+# Bump when the layout of the converted files changes
+DIAPARSER_CACHE_FORMAT = 1
+
+
+def quantize_diaparser(parser):
+    """Replace the parser's Linear and LSTM layers with dynamic int8 versions"""
+    parser.model = quantize_dynamic(parser.model, {nn.Linear, nn.LSTM}, dtype=torch.qint8)
+    parser.model.eval()
+    return parser
+
+
+@contextmanager
+def _legacy_torch_load():
+    """Let Parser.load unpickle the original archive on PyTorch 2.6+"""
+    original = torch.load
+
+    def load(*args, **kwargs):
+        kwargs['weights_only'] = False
+        return original(*args, **kwargs)
+
+    torch.load = load
+    try:
+        yield
+    finally:
+        torch.load = original
 
-def load_models():
-    """Load Stanza, DiaParser, and Prolog models"""
-    global nlp, diaparser, prolog
 
-    if nlp is None:
-        print("Loading Stanza Coptic model...")
-        # Download models if not present
-        try:
-            stanza.download('cop', verbose=False)
-        except:
-            pass  # Models might already be downloaded
-
-        nlp = stanza.Pipeline(
-            lang='cop',
-            processors='tokenize,pos',
-            verbose=False
-        )
-        print("✓ Stanza loaded")
-
-    if diaparser is None:
-        print("Loading DiaParser model...")
-        diaparser = Parser.load('cop.diaparser')
-        print("✓ DiaParser loaded")
-
-    if prolog is None:
+def _diaparser_cache_version():
+    """Key of the converted files: cache format, source archive and library versions"""
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        diaparser_version = version('diaparser')
+    except PackageNotFoundError:
+        diaparser_version = 'unknown'
+
+    source = Path(DIAPARSER_SOURCE)
+    if source.exists():
+        stat = source.stat()
+        source_key = f"{stat.st_size}:{stat.st_mtime_ns}"
+    else:
+        source_key = 'remote'  # Resolved by Parser.load
+
+    return {
+        'format': DIAPARSER_CACHE_FORMAT,
+        'source': f"{DIAPARSER_SOURCE}:{source_key}",
+        'diaparser': diaparser_version,
+        'torch': torch.__version__,
+    }
+
+
+def convert_diaparser(parser):
+    """Write the float parser as safetensors weights plus a skeleton"""
+    DIAPARSER_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    state_dict = {k: v.detach().cpu().contiguous() for k, v in parser.model.state_dict().items()}
+    save_file(state_dict, str(DIAPARSER_WEIGHTS))
+    torch.save(
+        {'cls': type(parser), 'args': parser.args, 'transform': parser.transform,
+         'version': _diaparser_cache_version()},
+        DIAPARSER_SKELETON
+    )
+
+
+def _load_diaparser_safetensors():
+    """Rebuild the parser from its skeleton and memory-mapped weights"""
+    skeleton = torch.load(DIAPARSER_SKELETON, map_location='cpu', weights_only=False)
+    if skeleton.get('version') != _diaparser_cache_version():
+        raise ValueError("cache is stale (source archive, diaparser or torch changed)")
+    state_dict = load_file(str(DIAPARSER_WEIGHTS), device=DEVICE)
+
+    cls, args = skeleton['cls'], skeleton['args']
+    model = cls.MODEL(**args)
+    pretrained = state_dict.pop('pretrained.weight', None)
+    if pretrained is not None:
+        model.load_pretrained(pretrained)
+    missing, unexpected = model.load_state_dict(state_dict, False)
+    # The pretrained embedding was restored by load_pretrained above
+    missing = [key for key in missing if not key.startswith('pretrained.')]
+    if missing or unexpected:
+        raise ValueError(f"weights do not match the model (missing {missing}, unexpected {unexpected})")
+    return cls(args, model.to(DEVICE), skeleton['transform'])
+
+
+def load_diaparser(from_archive=True):
+    """
+    Load DiaParser, preferring the safetensors copy over the original archive
+
+    Loading the archive patches torch.load for the whole process (see
+    _legacy_torch_load). With from_archive=False, None is returned instead,
+    so callers can do that load while no other thread uses torch.load.
+    """
+    parser = None
+    if load_file is not None and DIAPARSER_WEIGHTS.exists() and DIAPARSER_SKELETON.exists():
         try:
-            print("Loading Prolog rule engine...")
-            from coptic_prolog_rules import create_prolog_engine
-            prolog = create_prolog_engine()
-            print("✓ Prolog loaded")
+            parser = _load_diaparser_safetensors()
         except Exception as e:
-            print(f"⚠️  Prolog not available: {e}")
-            prolog = None
+            print(f"⚠️  Could not load DiaParser safetensors, rebuilding: {e}")
+
+    if parser is None:
+        if not from_archive:
+            return None
+        with _legacy_torch_load():
+            parser = Parser.load(DIAPARSER_SOURCE)
+
+        # Convert once so later cold starts skip pickle for the weights
+        if save_file is not None:
+            try:
+                convert_diaparser(parser)
+            except Exception as e:
+                print(f"⚠️  Could not write DiaParser safetensors: {e}")
+
+    # Packed int8 weights have no safetensors form, so quantize after loading
+    if QUANTIZE:
+        parser = quantize_diaparser(parser)
+    return parser
+
+
+def _load_stanza():
+    print("Loading Stanza Coptic model...")
+    pipeline = stanza.Pipeline(**STANZA_KWARGS)
+    print("✓ Stanza loaded")
+    return pipeline
+
+
+def _load_diaparser_model(from_archive=True):
+    print("Loading DiaParser model...")
+    parser = load_diaparser(from_archive)
+    if parser is None:
+        print("DiaParser safetensors cache unavailable, loading the archive after the other models")
+        return None
+    parser.model.to(DEVICE)
+    parser.model.eval()
+    print(f"✓ DiaParser loaded ({DEVICE}{', int8' if QUANTIZE else ''})")
+    return parser
+
+
+def _load_prolog():
+    try:
+        print("Loading Prolog rule engine...")
+        from coptic_prolog_rules import create_prolog_engine
+        engine = create_prolog_engine(use_prolog=PROLOG_DEBUG)
+        print("✓ Prolog loaded")
+        return engine
+    except Exception as e:
+        print(f"⚠️  Prolog not available: {e}")
+        return None
 
 
-def parse_coptic_text(text):
+def load_models():
+    """Load Stanza, DiaParser, and Prolog models"""
+    global nlp, diaparser, prolog, _loaded
+
+    if _loaded:
+        return
+
+    with _load_lock:
+        if _loaded:
+            return
+
+        if nlp is None:
+            # Download models if not present; kept out of the pool so the
+            # loaders below never race on a half-written model directory
+            try:
+                stanza.download('cop', verbose=False)
+            except:
+                pass  # Models might already be downloaded
+
+        # The three loaders are independent, so their file I/O and C
+        # extension work overlap instead of running back to back. DiaParser
+        # only loads its safetensors cache here: the archive load patches
+        # torch.load process-wide and would strip Stanza's loads of
+        # weights_only protection
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            f_stanza = pool.submit(_load_stanza) if nlp is None else None
+            f_dia = pool.submit(_load_diaparser_model, False) if diaparser is None else None
+            f_prolog = pool.submit(_load_prolog) if prolog is None else None
+
+            if f_stanza is not None:
+                nlp = f_stanza.result()
+            if f_dia is not None:
+                diaparser = f_dia.result()
+            if f_prolog is not None:
+                prolog = f_prolog.result()
+
+        # No usable cache: load the archive now that no other loader runs
+        if diaparser is None:
+            diaparser = _load_diaparser_model()
+
+        # Cached parses belong to the previously loaded models
+        _cache_clear()
+        _loaded = True
+
+        # Collect the garbage left by model loading, then move every object
+        # still alive in the process (models, pipelines, rule tables) to the
+        # permanent generation so later collections no longer scan them
+        gc.collect()
+        gc.freeze()
+
+
+def load_pretokenized_pipeline():
+    """Load the Stanza pipeline that skips the neural tokenizer (on first use)"""
+    global nlp_pretok
+
+    if nlp_pretok is None:
+        print("Loading Stanza pretokenized pipeline...")
+        nlp_pretok = stanza.Pipeline(tokenize_pretokenized=True, **STANZA_KWARGS)
+        print("✓ Stanza pretokenized pipeline loaded")
+
+    return nlp_pretok
+
+
+class MicroBatcher:
     """
-    Parse Coptic text and return formatted results
+    Coalesce concurrent requests into one batched model call
 
-    Args:
-        text: Input Coptic text
+    Callers submit a list of items and block on a Future for their results.
+    A single worker thread drains whatever arrives within `window` seconds
+    (up to `max_items` items), calls `batch_fn` once on all of them and
+    hands each caller back its own slice of the results.
+    """
 
-    Returns:
-        tuple: (text_output, html_table, status_message)
+    def __init__(self, batch_fn, window=0.01, max_items=256):
+        self.batch_fn = batch_fn
+        self.window = window
+        self.max_items = max_items
+        self._queue = queue.Queue()
+        self._worker = threading.Thread(target=self._run, daemon=True)
+        self._worker.start()
+
+    def submit(self, items):
+        """Queue a list of items; the Future resolves to their results"""
+        future = Future()
+        self._queue.put((list(items), future))
+        return future
+
+    def __call__(self, items):
+        return self.submit(items).result()
+
+    def _run(self):
+        while True:
+            pending = [self._queue.get()]
+            count = len(pending[0][0])
+            deadline = time.monotonic() + self.window
+
+            while count < self.max_items:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    request = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                pending.append(request)
+                count += len(request[0])
+
+            all_items = [item for items, _ in pending for item in items]
+            try:
+                results = self.batch_fn(all_items)
+            except Exception as e:
+                for _, future in pending:
+                    future.set_exception(e)
+                continue
+
+            offset = 0
+            for items, future in pending:
+                future.set_result(results[offset:offset + len(items)])
+                offset += len(items)
+
+
+@torch.inference_mode()
+def _tokenize_batch(texts):
+    """Run Stanza on several texts at once (one Document per text)"""
+    return nlp([Document([], text=text) for text in texts])
+
+
+@torch.inference_mode()
+def _tokenize_pretokenized_batch(texts):
+    """Run the pretokenized Stanza pipeline on several texts at once"""
+    return load_pretokenized_pipeline()([Document([], text=text) for text in texts])
+
+
+@torch.inference_mode()
+def _predict_batch(batch_tokens):
     """
-    if not text or not text.strip():
-        return "Please enter some Coptic text to parse.", "", "⚠️ No input provided"
+    Parse token lists with one DiaParser call; returns (arcs, rels) per sentence
 
-    try:
-        # Load models if needed
-        load_models()
+    Identical sentences in the batch are parsed once, and sentences seen in
+    earlier batches are served from the sentence cache.
+    """
+    keys = [tuple(tokens) for tokens in batch_tokens]
+    results = {key: _cache_get(_SENTENCE_CACHE, key) for key in keys}
+    missing = [key for key, result in results.items() if result is None]
+
+    if missing:
+        with torch.autocast('cpu', dtype=torch.bfloat16, enabled=CPU_BF16):
+            parsed = diaparser.predict([list(key) for key in missing], prob=False, verbose=False)
+        for key, arcs, rels in zip(missing, parsed.arcs, parsed.rels):
+            results[key] = (arcs, rels)
+            _cache_put(_SENTENCE_CACHE, key, (arcs, rels), _SENTENCE_CACHE_SIZE)
+
+    return [results[key] for key in keys]
+
+
+# Stanza and DiaParser only run on these workers, so requests from
+# concurrent Gradio sessions are merged into shared batches
+stanza_batcher = MicroBatcher(_tokenize_batch)
+stanza_pretok_batcher = MicroBatcher(_tokenize_pretokenized_batch)
+diaparser_batcher = MicroBatcher(_predict_batch, max_items=512)
 
-        # Tokenize with Stanza
-        doc_tok = nlp(text)
+# Finished results keyed by (text, pretokenized); values are plain strings
+_RESULT_CACHE = OrderedDict()
+_RESULT_CACHE_SIZE = 256
 
-        # Parse each sentence
-        all_results = []
-        text_output_lines = []
+# DiaParser (arcs, rels) keyed by the sentence's token tuple
+_SENTENCE_CACHE = OrderedDict()
+_SENTENCE_CACHE_SIZE = 1024
+
+_cache_lock = threading.Lock()
+
+# Sentences sent to DiaParser per batch before a partial result is shown
+STREAM_CHUNK_SIZE = 16
+
+# Per-word entry of the text output, filled from the word_data dict
+_TEXT_ROW = "  {id}. {form:15} → {head_word:15} [{deprel}]\n     POS: {upos:10} Lemma: {lemma}".format_map
+
+
+def _cache_get(cache, key):
+    with _cache_lock:
+        result = cache.get(key)
+        if result is not None:
+            cache.move_to_end(key)
+        return result
+
+
+def _cache_put(cache, key, result, size):
+    with _cache_lock:
+        cache[key] = result
+        cache.move_to_end(key)
+        while len(cache) > size:
+            cache.popitem(last=False)
+
+
+def _cache_clear():
+    with _cache_lock:
+        _RESULT_CACHE.clear()
+        _SENTENCE_CACHE.clear()
+
+
+def _parse_stream(text, pretokenized=False):
+    """
+    Run the Stanza + DiaParser + Prolog pipeline on validated input
 
-        for sent_idx, stanza_sentence in enumerate(doc_tok.sentences, 1):
-            # Extract tokens, POS tags, lemmas
-            tokens = [word.text for word in stanza_sentence.words]
-            pos_tags = [word.upos for word in stanza_sentence.words]
-            lemmas = [word.lemma if word.lemma else word.text for word in stanza_sentence.words]
+    Sentences are parsed in batches of STREAM_CHUNK_SIZE and a partial
+    result is yielded after each batch; the last item is the full result.
+    Model calls go through the micro-batchers and may share a forward
+    pass with other requests.
 
-            # Parse with DiaParser
-            parsed_result = diaparser.predict([tokens], prob=False, verbose=False)
+    Yields:
+        tuple: (text_output, html_table, status_message)
+    """
+    # Tokenize with Stanza (pretokenized input: one sentence per line,
+    # words separated by whitespace)
+    batcher = stanza_pretok_batcher if pretokenized else stanza_batcher
+    doc_tok = batcher([text])[0]
+
+    # Pass 1: collect tokens, POS tags, lemmas for every sentence
+    batch_tokens = []
+    batch_pos_tags = []
+    batch_lemmas = []
+
+    for stanza_sentence in doc_tok.sentences:
+        # Single pass over the words fills all three lists
+        tokens, pos_tags, lemmas = [], [], []
+        tokens_append, pos_append, lemma_append = tokens.append, pos_tags.append, lemmas.append
+        for word in stanza_sentence.words:
+            token = word.text
+            tokens_append(token)
+            pos_append(word.upos)
+            lemma_append(word.lemma or token)
+
+        batch_tokens.append(tokens)
+        batch_pos_tags.append(pos_tags)
+        batch_lemmas.append(lemmas)
+
+    # Pass 2: parse batches of sentences with DiaParser and build the output
+    num_sentences = len(batch_tokens)
+    html_blocks = []
+    text_output_lines = []
+
+    for start in range(0, num_sentences, STREAM_CHUNK_SIZE):
+        chunk = batch_tokens[start:start + STREAM_CHUNK_SIZE]
+        parsed_chunk = diaparser_batcher(chunk)
+
+        for c_idx, tokens in enumerate(chunk):
+            s_idx = start + c_idx
+            sent_idx = s_idx + 1
+            pos_tags = batch_pos_tags[s_idx]
+            lemmas = batch_lemmas[s_idx]
+            sent_arcs, sent_rels = parsed_chunk[c_idx]
 
             # Build text output for this sentence
             text_output_lines.append(f"\n{'='*60}")
@@ -146,44 +536,43 @@ def parse_coptic_text(text):
 
             # Create word data
             sentence_words = []
-            for i, token in enumerate(tokens):
-                head_idx = parsed_result.arcs[0][i]
-                rel = parsed_result.rels[0][i]
-                pos = pos_tags[i] if i < len(pos_tags) else "UNKNOWN"
-                lemma = lemmas[i] if i < len(lemmas) else token
+            padded = ["ROOT"] + tokens
+            num_padded = len(padded)
+            # tokens, pos_tags and lemmas come from the same Stanza words, so
+            # they always line up with each other and with the parse
+            for i, (token, pos, lemma, head_idx, rel) in enumerate(
+                    zip(tokens, pos_tags, lemmas, sent_arcs, sent_rels), start=1):
+                # Index 0 of the padded list is ROOT; one bounds check covers the rest
+                head_word = padded[head_idx] if 0 <= head_idx < num_padded else f"INVALID({head_idx})"
 
                 word_data = {
-                    'id': i + 1,
+                    'id': i,
                     'form': token,
                     'lemma': lemma,
                     'upos': pos,
                     'head': head_idx,
-                    'deprel': rel
+                    'deprel': rel,
+                    'head_word': head_word
                 }
                 sentence_words.append(word_data)
 
                 # Add to text output
-                # Bounds checking for head_idx
-                if head_idx == 0:
-                    head_word = "ROOT"
-                elif 0 < head_idx <= len(tokens):
-                    head_word = tokens[head_idx - 1]
-                else:
-                    head_word = f"INVALID({head_idx})"
-
-                text_output_lines.append(
-                    f"  {i+1}. {token:15} → {head_word:15} [{rel}]"
-                )
-                text_output_lines.append(
-                    f"     POS: {pos:10} Lemma: {lemma}"
-                )
+                text_output_lines.append(_TEXT_ROW(word_data))
 
-            # Prolog validation (if available)
-            if prolog and prolog.prolog_initialized:
+            # Prolog validation (if available); live queries are limited to
+            # sentences with a tripartite copula unless COPTIC_PROLOG_ALL=1
+            if prolog and prolog.prolog_initialized and (
+                not prolog.use_prolog or PROLOG_ALL_SENTENCES or not COPULAS.isdisjoint(tokens)
+            ):
                 heads = [word_data['head'] for word_data in sentence_words]
                 deprels = [word_data['deprel'] for word_data in sentence_words]
 
-                validation = prolog.validate_parse_tree(tokens, pos_tags, heads, deprels)
+                if prolog.use_prolog:
+                    # Live Prolog queries are not safe across handler threads
+                    with _prolog_lock:
+                        validation = prolog.validate_parse_tree(tokens, pos_tags, heads, deprels)
+                else:
+                    validation = prolog.validate_parse_tree(tokens, pos_tags, heads, deprels)
 
                 # Check for tripartite pattern
                 if validation.get("patterns_found"):
@@ -198,32 +587,73 @@ def parse_coptic_text(text):
                     for warning in validation["warnings"]:
                         text_output_lines.append(f"  - {warning}")
 
-            all_results.append({
+            html_blocks.append(render_sentence_html({
                 'sentence_id': sent_idx,
                 'text': ' '.join(tokens),
                 'words': sentence_words
-            })
+            }))
+
+        parsed_count = start + len(chunk)
+        if parsed_count < num_sentences:
+            yield (
+                '\n'.join(text_output_lines),
+                wrap_html_table(html_blocks),
+                f"⏳ Parsed {parsed_count}/{num_sentences} sentence(s)..."
+            )
 
-        # Generate text output
-        text_output = '\n'.join(text_output_lines)
+    # Generate text output
+    text_output = '\n'.join(text_output_lines)
 
-        # Generate HTML table
-        html_table = generate_html_table(all_results)
+    # Generate HTML table
+    html_table = wrap_html_table(html_blocks)
 
-        # Status message
-        num_sentences = len(doc_tok.sentences)
-        num_words = sum(len(sent.words) for sent in doc_tok.sentences)
+    # Status message
+    num_words = sum(len(tokens) for tokens in batch_tokens)
 
-        # Add Prolog status
-        prolog_status = ""
-        if prolog and prolog.prolog_initialized:
-            prolog_status = " | ✓ Prolog validation active"
-        else:
-            prolog_status = " | ⚠️ Prolog validation unavailable"
+    # Add Prolog status
+    prolog_status = ""
+    if prolog and prolog.prolog_initialized:
+        prolog_status = " | ✓ Prolog validation active"
+    else:
+        prolog_status = " | ⚠️ Prolog validation unavailable"
+
+    status = f"✓ Parsed {num_sentences} sentence(s) with {num_words} words{prolog_status}"
+
+    yield text_output, html_table, status
+
+
+def parse_coptic_text(text, pretokenized=False):
+    """
+    Parse Coptic text and stream formatted results
+
+    Gradio shows every yielded tuple, so long inputs display the first
+    sentences while the rest are still being parsed. Finished results are
+    cached and replayed for identical requests.
 
-        status = f"✓ Parsed {num_sentences} sentence(s) with {num_words} words{prolog_status}"
+    Args:
+        text: Input Coptic text
+        pretokenized: If True, treat each line as a sentence and split words
+            on whitespace instead of running Stanza's neural tokenizer
 
-        return text_output, html_table, status
+    Yields:
+        tuple: (text_output, html_table, status_message)
+    """
+    if not text or not text.strip():
+        yield "Please enter some Coptic text to parse.", "", "⚠️ No input provided"
+        return
+
+    try:
+        # Load models if needed
+        load_models()
+
+        key = (text, pretokenized)
+        result = _cache_get(_RESULT_CACHE, key)
+        if result is None:
+            for result in _parse_stream(text, pretokenized):
+                yield result
+            _cache_put(_RESULT_CACHE, key, result, _RESULT_CACHE_SIZE)
+        else:
+            yield result
 
     except Exception as e:
         # Detailed error message with traceback for debugging
@@ -252,13 +682,11 @@ Try:
 
 Technical details printed to console."""
 
-        return error_msg, f"<p style='color:red;'><b>Error:</b> {str(e)}</p>", f"❌ {type(e).__name__}: {str(e)[:100]}"
+        yield error_msg, f"<p style='color:red;'><b>Error:</b> {str(e)}</p>", f"❌ {type(e).__name__}: {str(e)[:100]}"
 
 
-def generate_html_table(results):
-    """Generate HTML table visualization of parse results"""
-
-    html = """
+# Static stylesheet and container opening for the HTML table view
+_CSS_BLOCK = """
     <style>
         .parse-container { font-family: 'Segoe UI', Arial, sans-serif; }
         .sentence-block {
@@ -318,60 +746,83 @@ def generate_html_table(results):
         }
     </style>
     <div class="parse-container">
+"""
+
+# Per-sentence table skeleton, compiled once
+_SENT_OPEN = Template("""
+    <div class="sentence-block">
+        <div class="sentence-header">Sentence $sid</div>
+        <div class="sentence-text">$stext</div>
+        <table>
+            <thead>
+                <tr>
+                    <th>ID</th>
+                    <th>Word</th>
+                    <th>Lemma</th>
+                    <th>POS</th>
+                    <th>Head</th>
+                    <th>Relation</th>
+                </tr>
+            </thead>
+            <tbody>
+    """)
+
+_SENT_CLOSE = """
+            </tbody>
+        </table>
+    </div>
     """
 
-    for result in results:
-        sent_id = result['sentence_id']
-        sent_text = result['text']
-        words = result['words']
-
-        html += f"""
-        <div class="sentence-block">
-            <div class="sentence-header">Sentence {sent_id}</div>
-            <div class="sentence-text">{sent_text}</div>
-            <table>
-                <thead>
-                    <tr>
-                        <th>ID</th>
-                        <th>Word</th>
-                        <th>Lemma</th>
-                        <th>POS</th>
-                        <th>Head</th>
-                        <th>Relation</th>
-                    </tr>
-                </thead>
-                <tbody>
-        """
-
-        for word in words:
-            # Bounds checking for head index
-            head_idx = word['head']
-            if head_idx == 0:
-                head_word = "ROOT"
-            elif 0 < head_idx <= len(words):
-                head_word = words[head_idx - 1]['form']
-            else:
-                head_word = f"INVALID({head_idx})"
-
-            html += f"""
-                    <tr>
-                        <td class="word-id">{word['id']}</td>
-                        <td class="word-form">{word['form']}</td>
-                        <td>{word['lemma']}</td>
-                        <td><span class="pos-tag">{word['upos']}</span></td>
-                        <td>{head_word} ({word['head']})</td>
-                        <td><span class="deprel">{word['deprel']}</span></td>
-                    </tr>
-            """
-
-        html += """
-                </tbody>
-            </table>
-        </div>
-        """
-
-    html += "</div>"
-    return html
+# Per-word table row
+_ROW = Template("""
+                <tr>
+                    <td class="word-id">$id</td>
+                    <td class="word-form">$form</td>
+                    <td>$lemma</td>
+                    <td><span class="pos-tag">$upos</span></td>
+                    <td>$hw ($head)</td>
+                    <td><span class="deprel">$deprel</span></td>
+                </tr>
+        """)
+
+
+def render_sentence_html(result):
+    """Render the table block for one parsed sentence"""
+    words = result['words']
+
+    parts = [_SENT_OPEN.substitute(sid=result['sentence_id'], stext=html.escape(result['text']))]
+
+    # Index 0 of the padded list is ROOT; one bounds check covers the rest
+    padded_forms = ["ROOT"] + [word['form'] for word in words]
+    num_padded = len(padded_forms)
+
+    for word in words:
+        head_idx = word['head']
+        head_word = padded_forms[head_idx] if 0 <= head_idx < num_padded else f"INVALID({head_idx})"
+
+        parts.append(_ROW.substitute(
+            id=word['id'],
+            form=html.escape(word['form']),
+            lemma=html.escape(word['lemma']),
+            upos=html.escape(word['upos']),
+            hw=html.escape(head_word),
+            head=head_idx,
+            deprel=html.escape(word['deprel'])
+        ))
+
+    parts.append(_SENT_CLOSE)
+
+    return ''.join(parts)
+
+
+def wrap_html_table(sentence_blocks):
+    """Wrap rendered sentence blocks with the stylesheet and container"""
+    return ''.join([_CSS_BLOCK, *sentence_blocks, "</div>"])
+
+
+def generate_html_table(results):
+    """Generate HTML table visualization of parse results"""
+    return wrap_html_table([render_sentence_html(result) for result in results])
 
 
 # Create Gradio interface
@@ -409,6 +860,11 @@ with gr.Blocks(title="Coptic Dependency Parser", theme=gr.themes.Soft()) as demo
                 parse_btn = gr.Button("🔍 Parse Text", variant="primary", size="lg")
                 clear_btn = gr.Button("🗑️ Clear", variant="secondary", size="lg")
 
+            pretokenized_input = gr.Checkbox(
+                label="Input is pre-tokenized (one sentence per line, words separated by spaces)",
+                value=False
+            )
+
             status_output = gr.Textbox(label="Status", interactive=False, lines=1)
 
     with gr.Tabs():
@@ -449,17 +905,18 @@ with gr.Blocks(title="Coptic Dependency Parser", theme=gr.themes.Soft()) as demo
     **Source Code:** [GitHub](https://github.com/Rogaton/coptic-dependency-parser)
     """)
 
-    # Connect Parse button to parsing function
+    # Connect Parse button to parsing function (a generator, so results stream)
     parse_btn.click(
         fn=parse_coptic_text,
-        inputs=[input_text],
-        outputs=[text_output, html_output, status_output]
+        inputs=[input_text, pretokenized_input],
+        outputs=[text_output, html_output, status_output],
+        api_name="parse"
     )
 
     # Also parse on Enter key
     input_text.submit(
         fn=parse_coptic_text,
-        inputs=[input_text],
+        inputs=[input_text, pretokenized_input],
         outputs=[text_output, html_output, status_output]
     )
 
@@ -477,4 +934,14 @@ with gr.Blocks(title="Coptic Dependency Parser", theme=gr.themes.Soft()) as demo
 # Launch demo
 if __name__ == "__main__":
     print("Starting Coptic Dependency Parser...")
+
+    # Load and warm up the models before serving (PRELOAD=0 skips this for dev)
+    if os.environ.get('PRELOAD', '1') != '0':
+        load_models()
+        for _ in parse_coptic_text("ⲁⲛⲟⲕ"):
+            pass
+        print("✓ Models preloaded")
+
+    # Several sessions may run at once; their model calls share micro-batches
+    demo.queue(default_concurrency_limit=8)
     demo.launch()
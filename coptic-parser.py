@@ -36,23 +36,34 @@ For detailed attribution, see CREDITS_AND_ATTRIBUTION.md
 
 import tkinter as tk
 from tkinter import scrolledtext, messagebox, ttk
-import stanza
 import threading
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+import matplotlib
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import numpy as np
 import webbrowser
 from pathlib import Path
+import os
 import signal
 import sys
+import hashlib
+from collections import OrderedDict
+from dataclasses import astuple, dataclass
+from functools import lru_cache, partial
+import warnings
+warnings.filterwarnings('ignore')
 
 # Fix PyTorch 2.6+ compatibility and __getitems__ error
-import torch
+# torch and stanza are only imported by the parser worker process (see
+# _import_torch), so the GUI starts without loading them
 import pickle
 
-# Store original torch.load
-_original_torch_load = torch.load
+# Original torch.load, stored when the patch is applied
+_original_torch_load = None
 
 def patched_torch_load(*args, **kwargs):
     """Patched torch.load with multiple compatibility fixes"""
@@ -69,11 +80,361 @@ def patched_torch_load(*args, **kwargs):
             return _original_torch_load(*args, **kwargs)
         raise
 
-# Apply the patch
-torch.load = patched_torch_load
+
+def _import_torch():
+    """Import torch and apply the torch.load patch (once) before any model loads"""
+    global _original_torch_load
+    import torch
+
+    if _original_torch_load is None:
+        _original_torch_load = torch.load
+        torch.load = patched_torch_load
+    return torch
 
 # Set matplotlib to use fonts that support Coptic Unicode
-plt.rcParams['font.family'] = ['Noto Sans Coptic', 'DejaVu Sans', 'sans-serif']
+matplotlib.rcParams['font.family'] = ['Noto Sans Coptic', 'DejaVu Sans', 'sans-serif']
+
+
+# Simple Coptic to Latin transliteration map
+COPTIC_TO_LATIN = {
+    'ⲁ': 'a', 'ⲃ': 'b', 'ⲅ': 'g', 'ⲇ': 'd', 'ⲉ': 'e', 'ⲍ': 'z',
+    'ⲏ': 'h', 'ⲑ': 'th', 'ⲓ': 'i', 'ⲕ': 'k', 'ⲗ': 'l', 'ⲙ': 'm',
+    'ⲛ': 'n', 'ⲝ': 'x', 'ⲟ': 'o', 'ⲡ': 'p', 'ⲣ': 'r', 'ⲥ': 's',
+    'ⲧ': 't', 'ⲩ': 'u', 'ⲫ': 'f', 'ⲭ': 'ch', 'ⲯ': 'ps', 'ⲱ': 'w',
+    'ϣ': 'sh', 'ϥ': 'f', 'ϧ': 'q', 'ϩ': 'h', 'ϫ': 'j', 'ϭ': 'c', 'ϯ': 'ti'
+}
+_TRANSLIT_TABLE = str.maketrans(COPTIC_TO_LATIN)
+
+
+def transliterate_coptic(coptic_text):
+    """
+    Convert Coptic text to Latin transliteration
+
+    Works on whole texts as well as single words: str.translate maps every
+    code point in one C pass, so batch callers should pass the full text
+    rather than transliterating word by word.
+    """
+    return coptic_text.translate(_TRANSLIT_TABLE)
+
+
+@lru_cache(maxsize=8192)
+def _transliterate_token(token):
+    """Memoized transliteration of single words for the tree view redraws"""
+    return token.translate(_TRANSLIT_TABLE)
+
+
+# Stanza settings shared by the full and pretokenized pipelines
+STANZA_KWARGS = {
+    'lang': 'cop',
+    'processors': 'tokenize,pos',  # Added POS tagging
+    'download_method': None,
+    'verbose': False
+}
+
+# Separators of the text results
+_SEP70 = "=" * 70
+_NL_SEP70 = "\n" + _SEP70
+_DASH70 = "-" * 70
+
+# Number of recent parses kept for instant re-parse of unchanged input
+PARSE_CACHE_SIZE = 32
+
+# Number of rendered sentence trees kept for blitting; each is a full-figure
+# RGBA buffer of a few MB
+TREE_CACHE_SIZE = 16
+
+# Odd, so the middle point of each arc (t = 0.5) anchors its label
+ARC_POINTS = 31
+
+# Below this many edges the NumPy arc builder is used even with Numba, so
+# ordinary sentences never wait for the kernel to compile or load
+ARC_KERNEL_MIN_EDGES = 64
+
+
+def _arc_segments_numpy(x_positions, child_idx, head_idx, y_base):
+    """Bezier arc points for each edge, shape (n_edges, ARC_POINTS, 2)"""
+    x_child = x_positions[child_idx]
+    x_head = x_positions[head_idx]
+    arc_height = 0.25 + 0.05 * np.abs(child_idx - head_idx)
+
+    t = np.linspace(0, 1, ARC_POINTS)[None, :]
+    x_arc = x_child[:, None] * (1-t) + x_head[:, None] * t
+    y_arc = y_base + 4 * arc_height[:, None] * t * (1-t)
+    return np.stack([x_arc, y_arc], axis=-1)
+
+
+# Numba is optional: with it long sentences use the compiled arc kernel
+# (cached on disk), without it the broadcast NumPy version above is used
+try:
+    from numba import njit
+except ImportError:
+    _arc_segments_numba = None
+else:
+    @njit(cache=True)
+    def _arc_segments_numba(x_positions, child_idx, head_idx, y_base):
+        """Bezier arc points for each edge, shape (n_edges, ARC_POINTS, 2)"""
+        n_edges = child_idx.shape[0]
+        segments = np.empty((n_edges, ARC_POINTS, 2))
+        for e in range(n_edges):
+            x_child = x_positions[child_idx[e]]
+            x_head = x_positions[head_idx[e]]
+            arc_height = 0.25 + 0.05 * abs(child_idx[e] - head_idx[e])
+            for k in range(ARC_POINTS):
+                t = k / (ARC_POINTS - 1)
+                segments[e, k, 0] = x_child * (1-t) + x_head * t
+                segments[e, k, 1] = y_base + 4 * arc_height * t * (1-t)
+        return segments
+
+
+def build_arc_segments(x_positions, child_idx, head_idx, y_base):
+    """Bezier arc points for each edge, shape (n_edges, ARC_POINTS, 2)"""
+    if _arc_segments_numba is not None and len(child_idx) >= ARC_KERNEL_MIN_EDGES:
+        return _arc_segments_numba(x_positions, child_idx, head_idx, y_base)
+    return _arc_segments_numpy(x_positions, child_idx, head_idx, y_base)
+
+
+# Parse results, with the attribute names of Stanza's Word/Sentence/Document
+@dataclass(slots=True)
+class Word:
+    id: int
+    text: str
+    lemma: str
+    upos: str
+    head: int
+    deprel: str
+    feats: str = ''
+
+
+@dataclass(slots=True)
+class Sentence:
+    text: str
+    words: list
+
+
+@dataclass(slots=True)
+class Doc:
+    sentences: list
+
+
+# One word row of the HTML export, filled from a dict once per word
+_HTML_ROW = """
+                <tr class="{row_class}">
+                    <td><strong>{id}</strong></td>
+                    <td class="coptic"><strong>{text}</strong></td>
+                    <td class="coptic">{lemma}</td>
+                    <td><span style="background:#e3f2fd;padding:3px 6px;border-radius:3px">{upos}</span></td>
+                    <td class="coptic"><strong>{head_text}</strong></td>
+                    <td><span style="background:#fff3e0;padding:3px 6px;border-radius:3px">{deprel}</span></td>
+                    <td style="font-size:12px">{feats}</td>
+                </tr>""".format_map
+
+# Opening of one sentence block of the HTML export
+_HTML_SENTENCE = """
+        <div class="sentence">
+            <div class="sentence-text coptic">Sentence {i}: {text}</div>
+            <table>
+                <tr>
+                    <th>ID</th><th>Form</th><th>Lemma</th><th>UPOS</th>
+                    <th>Head</th><th>Dependency</th><th>Features</th>
+                </tr>
+""".format_map
+
+
+# ===================================================================
+# PARSER WORKER PROCESS
+# ===================================================================
+
+# Models loaded inside the worker process
+_worker = {'nlp': None, 'nlp_pretok': None, 'diaparser': None, 'prolog': None}
+
+# Set once _import_diaparser has patched DiaParser in this process
+_diaparser_patched = False
+
+
+def _import_diaparser():
+    """Import the DiaParser Parser class, applying the DataLoader patch (once)"""
+    global _diaparser_patched
+    if not _diaparser_patched:
+        sys.path.insert(0, '/home/aldn/NLP/coptic-nlp')
+
+        # The torch patch was already applied by _import_torch
+
+        from diaparser.utils.data import Dataset
+        from diaparser.utils.transform import Sentence as DiaSentence
+
+        # Fix DiaParser __getitems__ compatibility issue with PyTorch DataLoader
+        for cls in (Dataset, DiaSentence):
+            original_getattr = cls.__getattr__
+
+            def patched_getattr(self_inner, name, _original=original_getattr):
+                """Patched __getattr__ to handle PyTorch DataLoader checks"""
+                if name in ('__getitems__', '__getitem__', '_is_protocol'):
+                    raise AttributeError(f"'{type(self_inner).__name__}' object has no attribute '{name}'")
+                return _original(self_inner, name)
+
+            cls.__getattr__ = patched_getattr
+
+        _diaparser_patched = True
+
+    from diaparser.parsers.parser import Parser
+    return Parser
+
+
+def _load_models():
+    # Using Stanza for tokenization instead of coptic-nlp to avoid compatibility issues
+    torch = _import_torch()
+    import stanza
+
+    if _worker['nlp'] is None:
+        # Load Stanza pipeline for Coptic tokenization and POS tagging
+        _worker['nlp'] = stanza.Pipeline(use_gpu=torch.cuda.is_available(), **STANZA_KWARGS)
+
+    # Load diaparser for dependency parsing
+    if _worker['diaparser'] is None:
+        Parser = _import_diaparser()
+        _worker['diaparser'] = Parser.load('/home/aldn/NLP/coptic-nlp/lib/cop.diaparser')
+
+    # Initialize Prolog engine for grammatical validation
+    if _worker['prolog'] is None:
+        try:
+            from coptic_prolog_rules import create_prolog_engine
+            _worker['prolog'] = create_prolog_engine()
+        except Exception as e:
+            print(f"Warning: Prolog integration not available: {e}")
+            _worker['prolog'] = False
+
+
+def _load_pretokenized_pipeline():
+    """Stanza pipeline that takes whitespace-separated tokens (loaded on first use)"""
+    if _worker['nlp_pretok'] is None:
+        torch = _import_torch()
+        import stanza
+        _worker['nlp_pretok'] = stanza.Pipeline(tokenize_pretokenized=True,
+                                                use_gpu=torch.cuda.is_available(), **STANZA_KWARGS)
+    return _worker['nlp_pretok']
+
+
+def _preload_worker():
+    """Background model load; errors resurface when _parse_worker retries"""
+    try:
+        _load_models()
+    except Exception as e:
+        print(f"Warning: model preload failed: {e}")
+
+
+def _parse_worker(text, pretokenized=False):
+    """Parse text in the worker process; returns (results text, Doc)"""
+    _load_models()
+    prolog = _worker['prolog']
+
+    # Step 1: Tokenization using Stanza (keeps sentences separate)
+    if pretokenized:
+        # One sentence per line, tokens split on whitespace
+        sentences = [line.split() for line in text.splitlines() if line.strip()]
+        doc_tok = _load_pretokenized_pipeline()(sentences)
+    else:
+        doc_tok = _worker['nlp'](text)
+
+    if len(doc_tok.sentences) == 0:
+        raise ValueError("No sentences were parsed from the input.")
+
+    # Step 2: Parse the sentences
+    parsed_sentences = []
+    all_results = []
+
+    # Extract words, POS tags, and lemmas from Stanza
+    # Note: Using words (not tokens) for consistent linguistic units
+    stanza_sentences = []
+    for sent_idx, stanza_sentence in enumerate(doc_tok.sentences, 1):
+        tokens = [word.text for word in stanza_sentence.words]
+        pos_tags = [word.upos for word in stanza_sentence.words]
+        lemmas = [word.lemma if word.lemma else word.text for word in stanza_sentence.words]
+
+        if tokens:
+            stanza_sentences.append((sent_idx, stanza_sentence, tokens, pos_tags, lemmas))
+
+    # Parse all sentences with one diaparser call
+    all_tokens = [tokens for _, _, tokens, _, _ in stanza_sentences]
+    parsed_batch = []
+    if all_tokens:
+        parsed_batch = _worker['diaparser'].predict(all_tokens, prob=False, verbose=False).sentences
+
+    for (sent_idx, stanza_sentence, tokens, pos_tags, lemmas), parsed_sentence in zip(
+            stanza_sentences, parsed_batch):
+        # Extract dependency information
+        heads = parsed_sentence.values[6]
+        deprels = parsed_sentence.values[7]
+
+        # Create word objects for this sentence
+        words = []
+        for word_id, (token, head, deprel, pos, lemma) in enumerate(zip(tokens, heads, deprels, pos_tags, lemmas), start=1):
+            words.append(Word(
+                id=word_id,
+                text=token,
+                lemma=lemma,  # lemma from Stanza
+                upos=pos,     # POS tag from Stanza
+                head=head,
+                deprel=deprel
+            ))
+
+        # Create sentence object
+        sentence_text = stanza_sentence.text
+        parsed_sentences.append(Sentence(text=sentence_text, words=words))
+
+        # Format results for this sentence
+        all_results.extend((
+            _NL_SEP70,
+            f"SENTENCE {sent_idx}: {sentence_text}",
+            _SEP70,
+            "\nDependency Structure:",
+            _DASH70,
+        ))
+
+        # Index 0 of the padded list is ROOT
+        head_texts = ["ROOT"] + tokens
+        n_heads = len(head_texts)
+        all_results.extend(
+            f"  {word.text:15} ({word.upos:6}) --{word.deprel:10}--> "
+            f"{head_texts[word.head] if word.head < n_heads else '?':15}"
+            for word in words
+        )
+
+        all_results.append(f"\nTokens in sentence: {len(words)}")
+
+        # Prolog validation (if available)
+        if prolog and prolog.prolog_initialized:
+            validation = prolog.validate_parse_tree(tokens, pos_tags, heads, deprels)
+
+            # Check for tripartite pattern
+            if validation.get("patterns_found"):
+                for pattern in validation["patterns_found"]:
+                    if pattern.get("is_tripartite"):
+                        all_results.append(f"\n✓ Prolog: {pattern['description']} detected")
+                        all_results.append(f"  Pattern: {pattern['pattern']}")
+
+            # Show warnings if any
+            if validation.get("warnings"):
+                all_results.append(f"\n⚠ Prolog Warnings:")
+                for warning in validation["warnings"]:
+                    all_results.append(f"  - {warning}")
+
+    # Format overall summary
+    results = []
+    results.append(f"Input text parsed successfully!")
+    results.append(f"Total sentences: {len(parsed_sentences)}")
+    results.append(f"Total tokens: {sum(len(s.words) for s in parsed_sentences)}")
+    results.append(_NL_SEP70)
+    results.extend(all_results)
+    results.append(_NL_SEP70)
+    results.append("\nNote: POS tags and lemmas provided by Stanza. Dependency parsing by DiaParser.")
+    results.append("Use the Dependency Graph tab to view individual sentence trees with navigation.")
+
+    # Classes defined in this script live in __mp_main__ inside the worker and
+    # can't be unpickled by the GUI process, so the doc travels as plain tuples
+    doc_data = [(sentence.text, [astuple(word) for word in sentence.words])
+                for sentence in parsed_sentences]
+    return "\n".join(results), doc_data
+
 
 class CopticParserGUI:
     def __init__(self, root):
@@ -81,17 +442,18 @@ class CopticParserGUI:
         self.root.title("Coptic NLP Tools - Parser & Dependency Analyzer")
         self.root.geometry("1200x800")
 
-        self.nlp = None
         self.current_doc = None
         self.current_sentence_idx = 0  # For navigating between sentences in graph view
 
-        # Initialize Prolog engine for grammatical validation
-        try:
-            from coptic_prolog_rules import create_prolog_engine
-            self.prolog = create_prolog_engine()
-        except Exception as e:
-            print(f"Warning: Prolog integration not available: {e}")
-            self.prolog = None
+        # Rendered pixels of each visited sentence's tree, so prev/next can
+        # blit them back instead of redrawing; _drawn_idx is the sentence
+        # whose artists are currently on the axes (least recently shown
+        # renders are evicted first; that sentence is simply redrawn)
+        self._tree_cache = OrderedDict()
+        self._drawn_idx = None
+
+        # Recent parses keyed by a hash of the input text: (results text, doc)
+        self._parse_cache = OrderedDict()
 
         # Coptic alphabet
         self.coptic_chars = [
@@ -101,22 +463,41 @@ class CopticParserGUI:
         ]
         
         # Simple Coptic to Latin transliteration map
-        self.coptic_to_latin = {
-            'ⲁ': 'a', 'ⲃ': 'b', 'ⲅ': 'g', 'ⲇ': 'd', 'ⲉ': 'e', 'ⲍ': 'z', 
-            'ⲏ': 'h', 'ⲑ': 'th', 'ⲓ': 'i', 'ⲕ': 'k', 'ⲗ': 'l', 'ⲙ': 'm', 
-            'ⲛ': 'n', 'ⲝ': 'x', 'ⲟ': 'o', 'ⲡ': 'p', 'ⲣ': 'r', 'ⲥ': 's', 
-            'ⲧ': 't', 'ⲩ': 'u', 'ⲫ': 'f', 'ⲭ': 'ch', 'ⲯ': 'ps', 'ⲱ': 'w',
-            'ϣ': 'sh', 'ϥ': 'f', 'ϧ': 'q', 'ϩ': 'h', 'ϫ': 'j', 'ϭ': 'c', 'ϯ': 'ti'
-        }
+        self.coptic_to_latin = COPTIC_TO_LATIN
         
         self.setup_gui()
+
+        self._start_worker()
+
+    def _start_worker(self):
+        # Parsing runs in a single spawned worker process so Python-side
+        # post-processing never holds this process's GIL; the models load
+        # there while the window comes up instead of on the first Parse click
+        self._executor = ProcessPoolExecutor(
+            max_workers=1, mp_context=multiprocessing.get_context('spawn')
+        )
+        # The first task reports the worker's pid, so it can be killed
+        # while a later task is still running
+        self._worker_pid = self._executor.submit(os.getpid)
+        self._executor.submit(_preload_worker)
+
+    def _restart_worker(self):
+        """Replace a worker process that died or hangs (e.g. out of memory or a crash in torch)"""
+        self.shutdown_worker()
+        self._start_worker()
+
+    def shutdown_worker(self):
+        """Stop the worker without waiting for a model load or parse to finish"""
+        # The interpreter's exit hook joins the pool, so kill its process first
+        try:
+            os.kill(self._worker_pid.result(timeout=5), signal.SIGTERM)
+        except (BrokenProcessPool, FutureTimeoutError, OSError):
+            pass  # Never started, or already gone
+        self._executor.shutdown(wait=False, cancel_futures=True)
     
     def transliterate_coptic(self, coptic_text):
-        """Convert Coptic text to Latin transliteration"""
-        result = ""
-        for char in coptic_text:
-            result += self.coptic_to_latin.get(char, char)
-        return result
+        """Convert a Coptic word to Latin transliteration (cached per word)"""
+        return _transliterate_token(coptic_text)
     
     def setup_gui(self):
         # Create notebook for tabs
@@ -157,14 +538,10 @@ class CopticParserGUI:
         button_frame = ttk.Frame(keyboard_frame)
         button_frame.pack()
         
-        row, col = 0, 0
-        for char in self.coptic_chars:
+        for i, char in enumerate(self.coptic_chars):
             btn = tk.Button(button_frame, text=char, font=("Noto Sans Coptic", 10),
-                           command=lambda c=char: self.insert_char(c), width=2, height=1)
-            btn.grid(row=row, column=col, padx=1, pady=1)
-            col += 1
-            if col > 15:
-                col, row = 0, row + 1
+                           command=partial(self.insert_char, char), width=2, height=1)
+            btn.grid(row=i // 16, column=i % 16, padx=1, pady=1)
         
         # Control buttons
         control_frame = ttk.Frame(parent)
@@ -178,6 +555,11 @@ class CopticParserGUI:
         clear_btn = tk.Button(control_frame, text="Clear", command=self.clear_input, 
                              font=("Arial", 10), bg="#f44336", fg="white")
         clear_btn.pack(side=tk.LEFT, padx=(0, 10))
+
+        self.pretokenized = tk.BooleanVar(value=False)
+        pretok_check = tk.Checkbutton(control_frame, text="Input is pre-tokenized (split on whitespace)",
+                                      variable=self.pretokenized, font=("Arial", 10))
+        pretok_check.pack(side=tk.LEFT, padx=(0, 10))
         
         quit_btn = tk.Button(control_frame, text="Quit", command=self.root.quit, 
                             font=("Arial", 10), bg="#9E9E9E", fg="white")
@@ -217,16 +599,33 @@ class CopticParserGUI:
         self.next_btn.pack(side=tk.RIGHT, padx=5)
 
         # Create matplotlib figure
-        self.fig, self.ax = plt.subplots(figsize=(12, 7))
+        # Figure is created directly so it stays out of pyplot's global figure manager
+        self.fig = Figure(figsize=(12, 7))
+        self.ax = self.fig.add_subplot(111)
         self.canvas = FigureCanvasTkAgg(self.fig, parent)
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        self.canvas.mpl_connect('resize_event', self.on_canvas_resize)
+        self.canvas.mpl_connect('draw_event', self.on_canvas_draw)
 
         # Initial empty plot
-        self.ax.text(0.5, 0.5, 'Parse text to see dependency graph',
+        self._placeholder = self.ax.text(0.5, 0.5, 'Parse text to see dependency graph',
                     ha='center', va='center', transform=self.ax.transAxes, fontsize=14)
         self.ax.set_xlim(0, 1)
         self.ax.set_ylim(0, 1)
         self.ax.axis('off')
+
+        # Artist pools reused by draw_dependency_tree
+        self._word_texts = []
+        self._pos_texts = []
+        self._orig_texts = []
+        self._arrows = []
+        self._label_texts = []
+        self._root_texts = []
+        self._xpos_cache = {}  # word x positions by sentence length
+        # The arcs (and the labels sitting on them) are animated: the axes
+        # draw skips them and on_canvas_draw renders them in one pass on top
+        self._arc_coll = LineCollection([], colors='red', linewidths=2.5, animated=True)
+        self.ax.add_collection(self._arc_coll, autolim=False)
     
     def setup_table_tab(self, parent):
         # Simple, direct interface for researchers
@@ -257,97 +656,121 @@ Exports parsed results as a formatted HTML table for:
                                      font=("Arial", 10), fg="#666")
         self.viewer_status.pack(pady=(10, 0))
     
+    def _pooled(self, pool, n, factory):
+        """First n artists of a pool (grown with factory as needed), hiding the rest"""
+        while len(pool) < n:
+            pool.append(factory())
+        for artist in pool[n:]:
+            artist.set_visible(False)
+        for artist in pool[:n]:
+            artist.set_visible(True)
+        return pool[:n]
+
+    def _new_word_text(self):
+        return self.ax.text(0, 0, '', ha='center', va='center',
+                            fontsize=12, bbox=dict(boxstyle="round,pad=0.4",
+                                                  facecolor="lightblue", edgecolor="blue"))
+
+    def _new_pos_text(self):
+        return self.ax.text(0, 0, '', ha='center', va='center',
+                            fontsize=10, style='italic', color='darkgreen', weight='bold')
+
+    def _new_orig_text(self):
+        return self.ax.text(0, 0, '', ha='center', va='center', fontsize=8, color='gray')
+
+    def _new_arrow(self):
+        return self.ax.annotate('', xy=(0, 0), xytext=(0, 0),
+                                arrowprops=dict(arrowstyle='->', color='red', lw=2.5))
+
+    def _new_label_text(self):
+        return self.ax.text(0, 0, '', ha='center', va='center', fontsize=10,
+                            bbox=dict(boxstyle="round,pad=0.3", facecolor="yellow", edgecolor="orange"),
+                            weight='bold', animated=True)
+
+    def _new_root_text(self):
+        return self.ax.text(0, 0, 'ROOT', ha='center', va='center',
+                            fontsize=14, color='red', weight='bold',
+                            bbox=dict(boxstyle="round,pad=0.3", facecolor="pink", edgecolor="red"))
+
     def draw_dependency_tree(self, sentence):
-        """Draw dependency tree for a sentence"""
-        self.ax.clear()
-        
+        """
+        Draw dependency tree for a sentence
+
+        The axes keep pools of text, arrow and arc artists that are updated in
+        place; pools grow to the longest sentence seen and extras are hidden.
+        """
+        self._placeholder.set_visible(False)
+
         words = [word.text for word in sentence.words]
         n_words = len(words)
         
-        if n_words == 0:
-            return
-        
         # Position words horizontally
-        x_positions = np.linspace(0.1, 0.9, n_words)
+        x_positions = self._xpos_cache.get(n_words)
+        if x_positions is None:
+            x_positions = self._xpos_cache[n_words] = np.linspace(0.1, 0.9, n_words)
         y_word = 0.3
         
         # Draw words and POS tags using transliteration
-        for i, (word, x) in enumerate(zip(words, x_positions)):
+        word_texts = self._pooled(self._word_texts, n_words, self._new_word_text)
+        pos_texts = self._pooled(self._pos_texts, n_words, self._new_pos_text)
+        orig_texts = self._pooled(self._orig_texts, n_words, self._new_orig_text)
+        for word, x, word_text, pos_text, orig_text in zip(
+                sentence.words, x_positions, word_texts, pos_texts, orig_texts):
             # Use transliteration for display
-            display_text = self.transliterate_coptic(word)
-            
-            # Draw word box
-            self.ax.text(x, y_word, display_text, ha='center', va='center', 
-                        fontsize=12, bbox=dict(boxstyle="round,pad=0.4", 
-                                              facecolor="lightblue", edgecolor="blue"))
+            word_text.set_text(self.transliterate_coptic(word.text))
+            word_text.set_position((x, y_word))
             
-            # Draw POS tags
-            pos_tag = sentence.words[i].upos
-            self.ax.text(x, y_word - 0.12, pos_tag, ha='center', va='center', 
-                        fontsize=10, style='italic', color='darkgreen', weight='bold')
+            # POS tags
+            pos_text.set_text(word.upos)
+            pos_text.set_position((x, y_word - 0.12))
             
-            # Draw original Coptic text below (smaller)
-            self.ax.text(x, y_word - 0.18, f"({word})", ha='center', va='center',
-                        fontsize=8, color='gray')
-        
-        # Draw dependency arcs
-        for i, word in enumerate(sentence.words):
-            if word.head > 0:  # Not root
-                head_idx = word.head - 1
-                
-                if head_idx < len(x_positions):  # Safety check
-                    x_child = x_positions[i]
-                    x_head = x_positions[head_idx]
-                    
-                    # Calculate arc parameters
-                    distance = abs(i - head_idx)
-                    arc_height = 0.25 + 0.05 * distance
-                    
-                    # Draw the arc using a simple curved line
-                    if x_child != x_head:
-                        # Create arc points
-                        n_points = 30
-                        t = np.linspace(0, 1, n_points)
-                        
-                        # Bezier curve points
-                        x_arc = x_child * (1-t) + x_head * t
-                        y_arc = y_word + 0.08 + 4 * arc_height * t * (1-t)
-                        
-                        # Draw the arc
-                        self.ax.plot(x_arc, y_arc, 'red', linewidth=2.5)
-                        
-                        # Add arrowhead
-                        arrow_offset = 0.03 if x_child < x_head else -0.03
-                        self.ax.annotate('', xy=(x_head, y_word + 0.08), 
-                                       xytext=(x_head + arrow_offset, y_word + 0.12),
-                                       arrowprops=dict(arrowstyle='->', color='red', lw=2.5))
-                        
-                        # Add relation label
-                        label_x = (x_child + x_head) / 2
-                        label_y = y_word + 0.08 + arc_height
-                        self.ax.text(label_x, label_y, word.deprel, ha='center', va='center',
-                                   fontsize=10, bbox=dict(boxstyle="round,pad=0.3", 
-                                                         facecolor="yellow", edgecolor="orange"),
-                                   weight='bold')
+            # Original Coptic text below (smaller)
+            orig_text.set_text(f"({word.text})")
+            orig_text.set_position((x, y_word - 0.18))
+        
+        # Draw dependency arcs: every edge's curve is built in one batch
+        # and drawn as a single LineCollection
+        heads = np.array([word.head for word in sentence.words], dtype=int)
+        child_idx = np.arange(n_words)
+        head_idx = heads - 1
+        # Skip root, out-of-range heads and self-loops
+        keep = (heads > 0) & (head_idx < n_words) & (head_idx != child_idx)
+        child_idx, head_idx = child_idx[keep], head_idx[keep]
+
+        segments = build_arc_segments(x_positions, child_idx, head_idx, y_word + 0.08)
+        self._arc_coll.set_segments(segments)
+
+        # Arcs start at the dependent and end at the head; labels sit at the top
+        x_child = segments[:, 0, 0]
+        x_head = segments[:, -1, 0]
+        midpoints = segments[:, ARC_POINTS // 2]
+
+        n_edges = len(child_idx)
+        arrows = self._pooled(self._arrows, n_edges, self._new_arrow)
+        labels = self._pooled(self._label_texts, n_edges, self._new_label_text)
+        for c, xc, xh, mid, arrow, label in zip(child_idx, x_child, x_head, midpoints, arrows, labels):
+            # Arrowhead
+            arrow_offset = 0.03 if xc < xh else -0.03
+            arrow.xy = (xh, y_word + 0.08)
+            arrow.set_position((xh + arrow_offset, y_word + 0.12))
+
+            # Relation label
+            label.set_text(sentence.words[c].deprel)
+            label.set_position(tuple(mid))
         
         # Mark root
-        for i, word in enumerate(sentence.words):
-            if word.head == 0:  # Root word
-                self.ax.text(x_positions[i], y_word + 0.18, 'ROOT', ha='center', va='center',
-                           fontsize=14, color='red', weight='bold',
-                           bbox=dict(boxstyle="round,pad=0.3", facecolor="pink", edgecolor="red"))
+        root_idx = np.flatnonzero(heads == 0)
+        for i, root_text in zip(root_idx, self._pooled(self._root_texts, len(root_idx), self._new_root_text)):
+            root_text.set_position((x_positions[i], y_word + 0.18))
         
-        self.ax.set_xlim(0, 1)
-        self.ax.set_ylim(0, 1)
         self.ax.set_title(f'Dependency Tree: {sentence.text}', fontsize=16, pad=20, weight='bold')
-        self.ax.axis('off')
         
         self.canvas.draw()
     
-    def generate_html_viewer(self, doc):
-        """Generate HTML viewer from Stanza document"""
+    def generate_html_viewer(self, doc, out):
+        """Write the HTML viewer for a parsed document to the text file `out`"""
         
-        html = """<!DOCTYPE html>
+        out.write("""<!DOCTYPE html>
 <html>
 <head>
     <meta charset="UTF-8">
@@ -370,29 +793,21 @@ Exports parsed results as a formatted HTML table for:
 <body>
     <div class="container">
         <h1>📊 Coptic Dependency Analysis</h1>
-"""
+""")
         
         # Add statistics
         total_sentences = len(doc.sentences)
         total_tokens = sum(len(sent.words) for sent in doc.sentences)
         
-        html += f"""
+        out.write(f"""
         <div class="stats">
             <strong>Analysis Results:</strong> {total_sentences} sentences | {total_tokens} tokens
         </div>
-"""
+""")
         
         # Add each sentence
         for i, sentence in enumerate(doc.sentences, 1):
-            html += f"""
-        <div class="sentence">
-            <div class="sentence-text coptic">Sentence {i}: {sentence.text}</div>
-            <table>
-                <tr>
-                    <th>ID</th><th>Form</th><th>Lemma</th><th>UPOS</th>
-                    <th>Head</th><th>Dependency</th><th>Features</th>
-                </tr>
-"""
+            out.write(_HTML_SENTENCE({'i': i, 'text': sentence.text}))
             
             for word in sentence.words:
                 is_root = word.head == 0
@@ -400,34 +815,26 @@ Exports parsed results as a formatted HTML table for:
                 row_class = 'root' if is_root else ''
                 feats = word.feats if word.feats else ''
                 
-                html += f"""
-                <tr class="{row_class}">
-                    <td><strong>{word.id}</strong></td>
-                    <td class="coptic"><strong>{word.text}</strong></td>
-                    <td class="coptic">{word.lemma or '_'}</td>
-                    <td><span style="background:#e3f2fd;padding:3px 6px;border-radius:3px">{word.upos}</span></td>
-                    <td class="coptic"><strong>{head_text}</strong></td>
-                    <td><span style="background:#fff3e0;padding:3px 6px;border-radius:3px">{word.deprel}</span></td>
-                    <td style="font-size:12px">{feats}</td>
-                </tr>"""
+                out.write(_HTML_ROW({
+                    'row_class': row_class, 'id': word.id, 'text': word.text, 'lemma': word.lemma or '_',
+                    'upos': word.upos, 'head_text': head_text, 'deprel': word.deprel, 'feats': feats
+                }))
             
-            html += "</table></div>"
+            out.write("</table></div>")
         
-        html += """
+        out.write("""
         <div style="text-align: center; margin-top: 30px; padding: 15px; background: #f0f0f0; border-radius: 8px;">
             <p style="color: #666; margin: 0;">Generated by Coptic NLP Tools - CopticScriptorium Project</p>
         </div>
         </div>
     </body>
-    </html>"""
-        
-        return html
+    </html>""")
     
     def setup_context_menu(self, widget):
         context_menu = tk.Menu(widget, tearoff=0)
         context_menu.add_command(label="Copy", command=lambda: widget.event_generate("<<Copy>>"))
         context_menu.add_command(label="Paste", command=lambda: widget.event_generate("<<Paste>>"))
-        context_menu.add_command(label="Select All", command=lambda: widget.tag_add(tk.SEL, "1.0", tk.end))
+        context_menu.add_command(label="Select All", command=lambda: widget.tag_add(tk.SEL, "1.0", tk.END))
         
         def show_context_menu(event):
             try:
@@ -444,19 +851,48 @@ Exports parsed results as a formatted HTML table for:
     def clear_input(self):
         self.input_text.delete(1.0, tk.END)
 
+    def show_sentence(self, idx):
+        """Show a sentence's tree, blitting the cached render when there is one"""
+        self.current_sentence_idx = idx
+        self.update_graph_navigation()
+
+        background = self._tree_cache.get(idx)
+        if background is not None:
+            self._tree_cache.move_to_end(idx)
+            self.canvas.restore_region(background)
+            self.canvas.blit(self.fig.bbox)
+            return
+
+        self.draw_dependency_tree(self.current_doc.sentences[idx])
+        self._drawn_idx = idx
+        self._tree_cache[idx] = self.canvas.copy_from_bbox(self.fig.bbox)
+        while len(self._tree_cache) > TREE_CACHE_SIZE:
+            self._tree_cache.popitem(last=False)
+
+    def on_canvas_draw(self, event):
+        """Draw the animated arcs, then their relation labels, over the text layer"""
+        self.ax.draw_artist(self._arc_coll)
+        for label in self._label_texts:
+            if label.get_visible():
+                self.ax.draw_artist(label)
+
+    def on_canvas_resize(self, event):
+        """Cached renders no longer match the canvas size"""
+        self._tree_cache.clear()
+        # A resize redraws the artists on the axes, which may belong to
+        # another sentence than the blitted one on screen
+        if self.current_doc and self._drawn_idx != self.current_sentence_idx:
+            self.root.after_idle(self.show_sentence, self.current_sentence_idx)
+
     def prev_sentence(self):
         """Navigate to previous sentence in graph view"""
         if self.current_doc and self.current_sentence_idx > 0:
-            self.current_sentence_idx -= 1
-            self.update_graph_navigation()
-            self.draw_dependency_tree(self.current_doc.sentences[self.current_sentence_idx])
+            self.show_sentence(self.current_sentence_idx - 1)
 
     def next_sentence(self):
         """Navigate to next sentence in graph view"""
         if self.current_doc and self.current_sentence_idx < len(self.current_doc.sentences) - 1:
-            self.current_sentence_idx += 1
-            self.update_graph_navigation()
-            self.draw_dependency_tree(self.current_doc.sentences[self.current_sentence_idx])
+            self.show_sentence(self.current_sentence_idx + 1)
 
     def update_graph_navigation(self):
         """Update navigation buttons and label"""
@@ -474,197 +910,65 @@ Exports parsed results as a formatted HTML table for:
         self.prev_btn.config(state=tk.NORMAL if self.current_sentence_idx > 0 else tk.DISABLED)
         self.next_btn.config(state=tk.NORMAL if self.current_sentence_idx < total - 1 else tk.DISABLED)
     
-    def load_parser(self):
-        # Using Stanza for tokenization instead of coptic-nlp to avoid compatibility issues
-        import warnings
-        warnings.filterwarnings('ignore')
-
-        if self.nlp is None:
-            # Load Stanza pipeline for Coptic tokenization and POS tagging
-            self.nlp = stanza.Pipeline(
-                lang='cop',
-                processors='tokenize,pos',  # Added POS tagging
-                download_method=None,
-                verbose=False
-            )
-
-        # Load diaparser for dependency parsing
-        if not hasattr(self, 'diaparser'):
-            import sys
-            sys.path.insert(0, '/home/aldn/NLP/coptic-nlp')
-
-            # The torch patch was already applied at module level (lines 50-73)
-
-            from diaparser.parsers.parser import Parser
-
-            # Fix DiaParser __getitems__ compatibility issue with PyTorch DataLoader
-            if not hasattr(self, '_diaparser_patched'):
-                from diaparser.utils.data import Dataset
-                from diaparser.utils.transform import Sentence
-
-                # Patch Dataset to handle __getitems__ check
-                original_dataset_getattr = Dataset.__getattr__
-
-                def patched_dataset_getattr(self_inner, name):
-                    """Patched __getattr__ to handle PyTorch DataLoader checks"""
-                    if name in ('__getitems__', '__getitem__', '_is_protocol'):
-                        raise AttributeError(f"'{type(self_inner).__name__}' object has no attribute '{name}'")
-                    return original_dataset_getattr(self_inner, name)
-
-                Dataset.__getattr__ = patched_dataset_getattr
-
-                # Patch Sentence to handle __getitems__ check
-                original_sentence_getattr = Sentence.__getattr__
-
-                def patched_sentence_getattr(self_inner, name):
-                    """Patched __getattr__ to handle PyTorch DataLoader checks"""
-                    if name in ('__getitems__', '__getitem__', '_is_protocol'):
-                        raise AttributeError(f"'{type(self_inner).__name__}' object has no attribute '{name}'")
-                    return original_sentence_getattr(self_inner, name)
-
-                Sentence.__getattr__ = patched_sentence_getattr
-                self._diaparser_patched = True
-
-            self.diaparser = Parser.load('/home/aldn/NLP/coptic-nlp/lib/cop.diaparser')
-    
     def parse_text(self):
         input_text = self.input_text.get(1.0, tk.END).strip()
         
         if not input_text:
             messagebox.showwarning("Warning", "Please enter some Coptic text to parse.")
             return
+
+        pretokenized = self.pretokenized.get()
+        key = (hashlib.blake2b(input_text.encode('utf-8'), digest_size=16).digest(), pretokenized)
+        cached = self._parse_cache.get(key)
+        if cached is not None:
+            self._parse_cache.move_to_end(key)
+            self.update_results(*cached)
+            return
         
         self.parse_button.config(state=tk.DISABLED)
-        
-        thread = threading.Thread(target=self.do_parse, args=(input_text,))
-        thread.daemon = True
-        thread.start()
-    
-    def do_parse(self, text):
-        try:
-            self.load_parser()
-
-            # Step 1: Tokenization using Stanza (keeps sentences separate)
-            doc_tok = self.nlp(text)
-
-            if len(doc_tok.sentences) == 0:
-                raise ValueError("No sentences were parsed from the input.")
-
-            # Step 2: Parse each sentence separately
-            import warnings
-            warnings.filterwarnings('ignore')
-
-            parsed_sentences = []
-            all_results = []
-
-            for sent_idx, stanza_sentence in enumerate(doc_tok.sentences, 1):
-                # Extract words, POS tags, and lemmas from Stanza
-                # Note: Using words (not tokens) for consistent linguistic units
-                tokens = [word.text for word in stanza_sentence.words]
-                pos_tags = [word.upos for word in stanza_sentence.words]
-                lemmas = [word.lemma if word.lemma else word.text for word in stanza_sentence.words]
-
-                if not tokens:
-                    continue
-
-                # Parse this sentence with diaparser
-                parsed_result = self.diaparser.predict([tokens], prob=False, verbose=False)
-                parsed_sentence = parsed_result.sentences[0]
-
-                # Extract dependency information
-                heads = parsed_sentence.values[6]
-                deprels = parsed_sentence.values[7]
-
-                # Create word objects for this sentence
-                words = []
-                for word_id, (token, head, deprel, pos, lemma) in enumerate(zip(tokens, heads, deprels, pos_tags, lemmas), start=1):
-                    word_obj = type('Word', (), {
-                        'id': word_id,
-                        'text': token,
-                        'lemma': lemma,  # lemma from Stanza
-                        'upos': pos,     # POS tag from Stanza
-                        'head': head,
-                        'deprel': deprel,
-                        'feats': ''
-                    })()
-                    words.append(word_obj)
-
-                # Create sentence object
-                sentence_text = stanza_sentence.text
-                sentence_obj = type('Sentence', (), {
-                    'text': sentence_text,
-                    'words': words
-                })()
-                parsed_sentences.append(sentence_obj)
-
-                # Format results for this sentence
-                all_results.append(f"\n{'='*70}")
-                all_results.append(f"SENTENCE {sent_idx}: {sentence_text}")
-                all_results.append('='*70)
-                all_results.append("\nDependency Structure:")
-                all_results.append('-'*70)
-
-                for word in words:
-                    if word.head == 0:
-                        head_text = "ROOT"
-                    else:
-                        head_text = words[word.head-1].text if word.head <= len(words) else "?"
-                    all_results.append(f"  {word.text:15} ({word.upos:6}) --{word.deprel:10}--> {head_text:15}")
-
-                all_results.append(f"\nTokens in sentence: {len(words)}")
-
-                # Prolog validation (if available)
-                if self.prolog and self.prolog.prolog_initialized:
-                    validation = self.prolog.validate_parse_tree(tokens, pos_tags, heads, deprels)
-
-                    # Check for tripartite pattern
-                    if validation.get("patterns_found"):
-                        for pattern in validation["patterns_found"]:
-                            if pattern.get("is_tripartite"):
-                                all_results.append(f"\n✓ Prolog: {pattern['description']} detected")
-                                all_results.append(f"  Pattern: {pattern['pattern']}")
-
-                    # Show warnings if any
-                    if validation.get("warnings"):
-                        all_results.append(f"\n⚠ Prolog Warnings:")
-                        for warning in validation["warnings"]:
-                            all_results.append(f"  - {warning}")
-
-            # Create doc object with all sentences
-            doc = type('Doc', (), {
-                'sentences': parsed_sentences
-            })()
-
-            self.current_doc = doc
-            self.current_sentence_idx = 0  # Reset to first sentence
-
-            # Format overall summary
-            results = []
-            results.append(f"Input text parsed successfully!")
-            results.append(f"Total sentences: {len(parsed_sentences)}")
-            results.append(f"Total tokens: {sum(len(s.words) for s in parsed_sentences)}")
-            results.append("\n" + "="*70)
-            results.extend(all_results)
-            results.append("\n" + "="*70)
-            results.append("\nNote: POS tags and lemmas provided by Stanza. Dependency parsing by DiaParser.")
-            results.append("Use the Dependency Graph tab to view individual sentence trees with navigation.")
-
-            self.root.after(0, self.update_results, "\n".join(results), doc)
 
+        try:
+            future = self._executor.submit(_parse_worker, input_text, pretokenized)
+        except BrokenProcessPool:
+            # The worker died while idle (e.g. during the model preload)
+            self._restart_worker()
+            future = self._executor.submit(_parse_worker, input_text, pretokenized)
+        future.add_done_callback(partial(self._on_parse_done, key))
+
+    def _on_parse_done(self, key, future):
+        # Runs on the executor's result thread; hand back to the Tk loop
+        try:
+            results, doc_data = future.result()
+        except BrokenProcessPool:
+            self.root.after(0, self.worker_died)
+            return
         except Exception as e:
-            import traceback
-            traceback.print_exc()
             self.root.after(0, self.show_error, str(e))
+            return
+
+        # Create doc object with all sentences
+        doc = Doc(sentences=[Sentence(text=text, words=[Word(*word) for word in words])
+                             for text, words in doc_data])
+        self.root.after(0, self.finish_parse, key, results, doc)
+
+    def finish_parse(self, key, results, doc):
+        self._parse_cache[key] = (results, doc)
+        while len(self._parse_cache) > PARSE_CACHE_SIZE:
+            self._parse_cache.popitem(last=False)
+        self.update_results(results, doc)
     
     def update_results(self, results, doc):
+        self.current_doc = doc
+        self.current_sentence_idx = 0  # Reset to first sentence
+
         self.output_text.delete(1.0, tk.END)
         self.output_text.insert(tk.END, results)
 
         # Draw tree visualization for first sentence
+        self._tree_cache.clear()
+        self._drawn_idx = None
         if doc.sentences:
-            self.current_sentence_idx = 0
-            self.update_graph_navigation()
-            self.draw_dependency_tree(doc.sentences[0])
+            self.show_sentence(0)
 
         # Enable HTML viewer
         self.html_button.config(state=tk.NORMAL)
@@ -677,32 +981,51 @@ Exports parsed results as a formatted HTML table for:
             messagebox.showwarning("Warning", "No parsed data available. Parse text first.")
             return
 
-        try:
-            # Generate HTML
-            html_content = self.generate_html_viewer(self.current_doc)
+        # Write and open the file off the Tk thread so large exports don't freeze the UI
+        self.html_button.config(state=tk.DISABLED)
+        self.viewer_status.config(text="Exporting...", fg="#666")
+        html_file = Path("coptic_dependency_analysis.html")
+        thread = threading.Thread(target=self._do_export, args=(html_file, self.current_doc))
+        thread.daemon = True
+        thread.start()
 
-            # Save to file in current directory
-            html_file = Path("coptic_dependency_analysis.html")
+    def _do_export(self, html_file, doc):
+        try:
+            # Stream HTML straight into the file in current directory
             with open(html_file, 'w', encoding='utf-8') as f:
-                f.write(html_content)
+                self.generate_html_viewer(doc, f)
 
             # Open in browser directly - no popup
             file_url = f'file://{html_file.absolute()}'
             webbrowser.open(file_url)
 
-            # Update status to show file location (no popup interruption)
-            self.viewer_status.config(
-                text=f"✓ Exported to: {html_file.name}",
-                fg="#4CAF50"
-            )
+            self.root.after(0, self.export_done, html_file)
 
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to export HTML table: {e}")
+            self.root.after(0, self.export_failed, str(e))
+
+    def export_done(self, html_file):
+        # Update status to show file location (no popup interruption)
+        self.viewer_status.config(
+            text=f"✓ Exported to: {html_file.name}",
+            fg="#4CAF50"
+        )
+        self.html_button.config(state=tk.NORMAL)
+
+    def export_failed(self, error_msg):
+        messagebox.showerror("Error", f"Failed to export HTML table: {error_msg}")
+        self.html_button.config(state=tk.NORMAL)
     
     def show_error(self, error_msg):
         messagebox.showerror("Error", f"Parsing failed: {error_msg}")
         self.parse_button.config(state=tk.NORMAL)
 
+    def worker_died(self):
+        # Start a fresh worker (and model preload) before the next Parse click
+        self._restart_worker()
+        self.show_error("the parser process stopped unexpectedly and has been restarted; "
+                        "please parse again")
+
 if __name__ == "__main__":
     def signal_handler(sig, frame):
         sys.exit(0)
@@ -710,4 +1033,7 @@ if __name__ == "__main__":
     signal.signal(signal.SIGINT, signal_handler)
     root = tk.Tk()
     app = CopticParserGUI(root)
-    root.mainloop()
+    try:
+        root.mainloop()
+    finally:
+        app.shutdown_worker()
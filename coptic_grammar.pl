@@ -0,0 +1,156 @@
+% Coptic grammar rules for CopticPrologRules (coptic_prolog_rules.py)
+%
+% Consulted once when the engine starts. All predicates are static, so
+% SWI-Prolog compiles them with first-argument indexing.
+
+:- encoding(utf8).
+:- style_check(-singleton).
+
+% ===================================================================
+% COPTIC MORPHOLOGICAL RULES
+% ===================================================================
+
+% Article system: definite articles
+definite_article('ⲡ').   % masculine singular
+definite_article('ⲧ').   % feminine singular
+definite_article('ⲛ').   % plural
+definite_article('ⲡⲉ').   % masculine singular (variant)
+definite_article('ⲧⲉ').   % feminine singular (variant)
+definite_article('ⲛⲉ').   % plural (variant)
+
+% Pronominal system - Independent pronouns
+independent_pronoun('ⲁⲛⲟⲕ').   % I
+independent_pronoun('ⲛⲧⲟⲕ').   % you (m.sg)
+independent_pronoun('ⲛⲧⲟ').   % you (f.sg)
+independent_pronoun('ⲛⲧⲟϥ').   % he
+independent_pronoun('ⲛⲧⲟⲥ').   % she
+independent_pronoun('ⲁⲛⲟⲛ').   % we
+independent_pronoun('ⲛⲧⲱⲧⲛ').   % you (pl)
+independent_pronoun('ⲛⲧⲟⲟⲩ').   % they
+
+% Suffix pronouns (enclitic)
+suffix_pronoun('ⲓ').   % my/me
+suffix_pronoun('ⲕ').   % your (m.sg)
+suffix_pronoun('ϥ').   % his/him
+suffix_pronoun('ⲥ').   % her
+suffix_pronoun('ⲛ').   % our/us
+suffix_pronoun('ⲧⲛ').   % your (pl)
+suffix_pronoun('ⲟⲩ').   % their/them
+
+% Coptic verbal system - Conjugation bases (tense/aspect markers)
+conjugation_base('ⲁ').   % Perfect (aorist)
+conjugation_base('ⲛⲉ').   % Imperfect/past
+conjugation_base('ϣⲁ').   % Future/conditional
+conjugation_base('ⲙⲡⲉ').   % Negative perfect
+conjugation_base('ⲙⲛ').   % Negative existential
+conjugation_base('ⲉⲣϣⲁⲛ').   % Conditional
+
+% Auxiliary verbs (copulas); also COPULAS in coptic_prolog_rules.py
+copula('ⲡⲉ').   % is (m.sg)
+copula('ⲧⲉ').   % is (f.sg)
+copula('ⲛⲉ').   % are (pl)
+
+% ===================================================================
+% COPTIC SYNTACTIC RULES
+% ===================================================================
+
+% Noun phrase structure rules
+% Valid NP structure: Article + Noun (any word can be a noun, simplified)
+valid_np(Article, Noun) :- definite_article(Article).
+
+% Definiteness agreement rule - In Coptic, definiteness is marked by articles
+requires_definiteness(Noun, Article) :- definite_article(Article).
+
+% Tripartite nominal sentence pattern
+% Coptic tripartite pattern: Subject - Copula - Predicate
+% Example: ⲁⲛⲟⲕ ⲡⲉ ⲡⲛⲟⲩⲧⲉ (I am God); any word can be the predicate
+tripartite_sentence(Subject, Copula, Predicate) :- independent_pronoun(Subject), copula(Copula).
+
+% Verbal sentence patterns
+% Verbal sentence: Conjugation + Subject + Verb (any word can be a verb, simplified)
+verbal_sentence(Conj, Subject, Verb) :- conjugation_base(Conj), (independent_pronoun(Subject) ; definite_article(Subject)).
+
+% ===================================================================
+% DEPENDENCY VALIDATION RULES
+% ===================================================================
+
+% Validate subject-verb relationship
+valid_subject_verb(Subject, Verb, SubjPOS, VerbPOS) :- member(SubjPOS, ['PRON', 'NOUN', 'PROPN']), member(VerbPOS, ['VERB', 'AUX']).
+
+% Validate determiner-noun relationship
+valid_det_noun(Det, Noun, DetPOS, NounPOS) :- DetPOS = 'DET', member(NounPOS, ['NOUN', 'PROPN']).
+
+% Validate modifier relationships
+valid_modifier(Head, Modifier, ModPOS) :- member(ModPOS, ['ADJ', 'ADV', 'DET']).
+
+% Validate punctuation assignments - content words should NOT be punct
+% Only actual punctuation marks (PUNCT POS tag) should have punct relation
+invalid_punct(Word, POS, Relation) :- Relation = 'punct', member(POS, ['VERB', 'NOUN', 'PRON', 'PROPN', 'DET', 'ADJ', 'ADV', 'AUX', 'NUM']).
+
+% Whole-sentence validation in one query: takes a list of
+% dep(Index, Word, Head, DepPOS, HeadPOS, Relation) terms and returns
+% [Index, Kind, Suggestion] lists, where Kind is subject_verb, det_noun
+% or punct and Suggestion is a relation or 'none'
+validate_all([], []).
+validate_all([dep(I, W, H, DP, HP, R)|T], Out) :- validate_one(I, W, H, DP, HP, R, Ws), validate_all(T, Rest), append(Ws, Rest, Out).
+validate_one(I, W, H, DP, HP, R, Ws) :- check_relation(I, W, H, DP, HP, R, W1), check_punct(I, W, DP, HP, R, W2), append(W1, W2, Ws).
+check_relation(I, W, H, DP, HP, R, Ws) :- member(R, [nsubj, csubj]), !, (valid_subject_verb(W, H, DP, HP) -> Ws = [] ; Ws = [[I, subject_verb, none]]).
+check_relation(I, W, H, DP, HP, det, Ws) :- !, (valid_det_noun(W, H, DP, HP) -> Ws = [] ; Ws = [[I, det_noun, none]]).
+check_relation(_, _, _, _, _, _, []).
+check_punct(I, W, DP, HP, R, [[I, punct, S]]) :- invalid_punct(W, DP, R), !, (suggest_correction(DP, HP, S0) -> S = S0 ; S = none).
+check_punct(_, _, _, _, _, []).
+
+% ===================================================================
+% ERROR CORRECTION RULES
+% ===================================================================
+
+% Suggest correct relation for DET (determiner)
+% DET before NOUN should be 'det' relation
+suggest_correction('DET', _, 'det').
+
+% Suggest correct relation for PRON (pronoun)
+% PRON is typically subject (nsubj), object (obj), or possessive
+suggest_correction('PRON', 'VERB', 'nsubj').   % Pronoun before verb = subject
+suggest_correction('PRON', 'AUX', 'nsubj').   % Pronoun before aux = subject
+suggest_correction('PRON', _, 'nsubj').   % Default for pronoun
+
+% Suggest correct relation for NOUN
+suggest_correction('NOUN', 'VERB', 'obj').   % Noun after verb = object
+suggest_correction('NOUN', 'AUX', 'nsubj').   % Noun after copula = predicate nominal
+suggest_correction('NOUN', _, 'obl').   % Default for noun
+
+% Suggest correct relation for VERB
+% Main verbs are often root, ccomp (complement clause), or advcl (adverbial clause)
+suggest_correction('VERB', 'SCONJ', 'ccomp').   % Verb after subordinator = complement
+suggest_correction('VERB', 'VERB', 'ccomp').   % Verb after verb = complement
+suggest_correction('VERB', _, 'root').   % Default for verb
+
+% Suggest correct relation for AUX (auxiliary/copula)
+suggest_correction('AUX', _, 'cop').   % Copula relation
+
+% Suggest correct relation for ADJ (adjective)
+suggest_correction('ADJ', 'NOUN', 'amod').   % Adjective modifying noun
+
+% Suggest correct relation for ADV (adverb)
+suggest_correction('ADV', _, 'advmod').   % Adverbial modifier
+
+% Suggest correct relation for NUM (number)
+suggest_correction('NUM', 'NOUN', 'nummod').   % Number modifying noun
+suggest_correction('NUM', _, 'obl').   % Default for number (temporal/oblique)
+
+% ===================================================================
+% MORPHOLOGICAL ANALYSIS RULES
+% ===================================================================
+%
+% analyze_morphology scans the article and suffix lists in Python
+% (COPTIC_ARTICLES / COPTIC_SUFFIXES in coptic_prolog_rules.py); these
+% rules remain for query_prolog
+
+% Clitic attachment patterns
+has_suffix_pronoun(Word, Base, Suffix) :- atom_concat(Base, Suffix, Word), suffix_pronoun(Suffix), atom_length(Base, BaseLen), BaseLen > 0.
+
+% Article stripping for lemmatization
+strip_article(Word, Lemma) :- definite_article(Article), atom_concat(Article, Lemma, Word), atom_length(Lemma, LemmaLen), LemmaLen > 0.
+
+% If no article found, word is its own lemma
+strip_article(Word, Word) :- \+ (definite_article(Article), atom_concat(Article, _, Word)).
@@ -6,16 +6,81 @@ Coptic Prolog Rules - Neural-Symbolic Integration
 Integrates Prolog logic programming with neural dependency parsing
 to enhance parsing accuracy through explicit grammatical rules.
 
-Uses janus (SWI-Prolog Python interface) for bidirectional integration.
+Uses janus (SWI-Prolog Python interface) for bidirectional integration,
+falling back to pyswip where janus_swi is not installed.
 
 Author: Coptic NLP Project
 License: CC BY-NC-SA 4.0
 """
 
-from pyswip import Prolog
+import logging
+import threading
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
 import warnings
 warnings.filterwarnings('ignore')
 
+logger = logging.getLogger(__name__)
+
+# janus_swi (SWI-Prolog >= 9.1) passes goals and answers with less
+# overhead; pyswip is the fallback for older installations
+try:
+    import janus_swi as janus
+except ImportError:
+    janus = None
+    from pyswip import Atom, Functor, Prolog, Query, Variable
+    from pyswip.core import (PL_discard_foreign_frame, PL_open_foreign_frame,
+                             PL_thread_attach_engine, PL_thread_self)
+
+
+# Static grammar rules, consulted once per engine
+GRAMMAR_FILE = Path(__file__).with_name('coptic_grammar.pl')
+
+
+# Python copies of definite_article/1 and suffix_pronoun/1 for morphology
+# scans. Articles keep the fact order, so the first match is the one
+# strip_article/2 finds; suffixes go longest first, as has_suffix_pronoun/3
+# does
+COPTIC_ARTICLES = ('ⲡ', 'ⲧ', 'ⲛ', 'ⲡⲉ', 'ⲧⲉ', 'ⲛⲉ')
+COPTIC_SUFFIXES = ('ⲧⲛ', 'ⲟⲩ', 'ⲓ', 'ⲕ', 'ϥ', 'ⲥ', 'ⲛ')
+
+# Copulas of copula/1; callers use them as a cheap marker for sentences
+# that may be tripartite before running any rules
+COPULAS = frozenset({'ⲡⲉ', 'ⲧⲉ', 'ⲛⲉ'})
+
+# Below this many words the compiled batch scan costs more than it saves
+BATCH_SCAN_MIN_WORDS = 64
+
+# Relations any validation rule can fire on; live Prolog validation skips
+# other edges
+RELEVANT_RELATIONS = frozenset({'nsubj', 'csubj', 'det', 'punct'})
+
+
+def _atom(text):
+    """Quote a Python string as a Prolog atom"""
+    return "'" + str(text).replace("\\", "\\\\").replace("'", "\\'") + "'"
+
+
+def _text(value):
+    """Python string for an atom from a query result (Atom or str)"""
+    return str(getattr(value, 'value', value))
+
+
+def _pair_keys(pairs):
+    """Sorted tab-joined keys of string pairs, for NumPy membership tests"""
+    return np.array(sorted(f"{a}\t{b}" for a, b in pairs), dtype=str)
+
+
+def _tripartite_result(subj, cop, pred, is_tripartite):
+    """Result dict of check_tripartite_pattern"""
+    return {
+        "is_tripartite": is_tripartite,
+        "pattern": f"{subj} - {cop} - {pred}" if is_tripartite else None,
+        "description": "Tripartite nominal sentence" if is_tripartite else None
+    }
+
 
 class CopticPrologRules:
     """
@@ -23,171 +88,127 @@ class CopticPrologRules:
     and enhancement.
     """
 
-    def __init__(self):
-        """Initialize Prolog engine and load Coptic grammar rules"""
+    def __init__(self, use_prolog=False, verbose=False):
+        """
+        Initialize Prolog engine and load Coptic grammar rules
+
+        Args:
+            use_prolog: Validate by querying the Prolog rules on every call
+                (for extended rule sets) instead of the rule tables compiled
+                from them at startup
+            verbose: Also print startup progress to stdout
+        """
         self.prolog_initialized = False
         self.prolog = None
+        self.use_prolog = use_prolog
+        self.verbose = verbose
+
+        # Rule tables from compile_rules(); validation delegates to them
+        # unless use_prolog is set
+        self._compiled = None
+
+        # Per-engine memo of the pure word-level queries; Coptic text repeats
+        # articles, pronouns and common nouns heavily
+        self._morphology_cache = lru_cache(maxsize=4096)(self._analyze_affixes)
+        self._tripartite_cache = lru_cache(maxsize=4096)(self._query_tripartite)
+
+        # Interned atoms for the pyswip backend; the same articles, pronouns
+        # and POS tags recur in every sentence. Atoms and functors are global
+        # to the Prolog process, so any thread may reuse them (terms are not)
+        self._atom_cache = {}
+
         self._initialize_prolog()
 
     def _initialize_prolog(self):
         """Initialize SWI-Prolog and define Coptic grammatical rules"""
         try:
-            # Initialize pyswip Prolog instance
-            self.prolog = Prolog()
+            if janus is None:
+                # Initialize pyswip Prolog instance
+                self.prolog = Prolog()
 
             # Define Coptic-specific grammatical rules
             self._load_coptic_grammar()
 
+            if janus is None:
+                # Goal constructors for the per-word checks; goals built from
+                # terms skip parsing a query string on every call
+                self._valid_subject_verb = Functor("valid_subject_verb", 4)
+                self._valid_det_noun = Functor("valid_det_noun", 4)
+                self._tripartite_sentence = Functor("tripartite_sentence", 3)
+
             self.prolog_initialized = True
-            print("✓ Prolog engine initialized successfully")
+            self._report("✓ Prolog engine initialized successfully")
+
+            if not self.use_prolog:
+                try:
+                    self._compiled = self.compile_rules()
+                    self._report("✓ Prolog rules compiled")
+                except Exception as e:
+                    logger.warning("Could not compile Prolog rules, using live queries: %s", e)
+                    self.use_prolog = True
 
         except Exception as e:
-            print(f"⚠️  Warning: Prolog initialization failed: {e}")
-            print("   Parser will continue without Prolog validation")
+            logger.warning("Prolog initialization failed: %s; "
+                           "parser will continue without Prolog validation", e)
             self.prolog_initialized = False
 
     def _load_coptic_grammar(self):
-        """Load Coptic linguistic rules into Prolog"""
-
-        # ===================================================================
-        # COPTIC MORPHOLOGICAL RULES
-        # ===================================================================
-
-        # Article system: definite articles
-        self.prolog.assertz("definite_article('ⲡ')")      # masculine singular
-        self.prolog.assertz("definite_article('ⲧ')")      # feminine singular
-        self.prolog.assertz("definite_article('ⲛ')")      # plural
-        self.prolog.assertz("definite_article('ⲡⲉ')")     # masculine singular (variant)
-        self.prolog.assertz("definite_article('ⲧⲉ')")     # feminine singular (variant)
-        self.prolog.assertz("definite_article('ⲛⲉ')")     # plural (variant)
-
-        # Pronominal system - Independent pronouns
-        self.prolog.assertz("independent_pronoun('ⲁⲛⲟⲕ')")     # I
-        self.prolog.assertz("independent_pronoun('ⲛⲧⲟⲕ')")     # you (m.sg)
-        self.prolog.assertz("independent_pronoun('ⲛⲧⲟ')")      # you (f.sg)
-        self.prolog.assertz("independent_pronoun('ⲛⲧⲟϥ')")     # he
-        self.prolog.assertz("independent_pronoun('ⲛⲧⲟⲥ')")     # she
-        self.prolog.assertz("independent_pronoun('ⲁⲛⲟⲛ')")     # we
-        self.prolog.assertz("independent_pronoun('ⲛⲧⲱⲧⲛ')")    # you (pl)
-        self.prolog.assertz("independent_pronoun('ⲛⲧⲟⲟⲩ')")    # they
-
-        # Suffix pronouns (enclitic)
-        self.prolog.assertz("suffix_pronoun('ⲓ')")   # my/me
-        self.prolog.assertz("suffix_pronoun('ⲕ')")   # your (m.sg)
-        self.prolog.assertz("suffix_pronoun('ϥ')")   # his/him
-        self.prolog.assertz("suffix_pronoun('ⲥ')")   # her
-        self.prolog.assertz("suffix_pronoun('ⲛ')")   # our/us
-        self.prolog.assertz("suffix_pronoun('ⲧⲛ')")  # your (pl)
-        self.prolog.assertz("suffix_pronoun('ⲟⲩ')")  # their/them
-
-        # Coptic verbal system - Conjugation bases (tense/aspect markers)
-        self.prolog.assertz("conjugation_base('ⲁ')")      # Perfect (aorist)
-        self.prolog.assertz("conjugation_base('ⲛⲉ')")     # Imperfect/past
-        self.prolog.assertz("conjugation_base('ϣⲁ')")     # Future/conditional
-        self.prolog.assertz("conjugation_base('ⲙⲡⲉ')")    # Negative perfect
-        self.prolog.assertz("conjugation_base('ⲙⲛ')")     # Negative existential
-        self.prolog.assertz("conjugation_base('ⲉⲣϣⲁⲛ')")  # Conditional
-
-        # Auxiliary verbs (copulas)
-        self.prolog.assertz("copula('ⲡⲉ')")          # is (m.sg)
-        self.prolog.assertz("copula('ⲧⲉ')")          # is (f.sg)
-        self.prolog.assertz("copula('ⲛⲉ')")          # are (pl)
-
-        # ===================================================================
-        # COPTIC SYNTACTIC RULES
-        # ===================================================================
-
-        # Noun phrase structure rules
-        # Valid NP structure: Article + Noun
-        self.prolog.assertz("valid_np(Article, Noun) :- definite_article(Article), noun_compatible(Noun)")
-
-        # Helper: Any word can be a noun (simplified)
-        self.prolog.assertz("noun_compatible(_)")
-
-        # Definiteness agreement rule - In Coptic, definiteness is marked by articles
-        self.prolog.assertz("requires_definiteness(Noun, Article) :- definite_article(Article)")
-
-        # Tripartite nominal sentence pattern
-        # Coptic tripartite pattern: Subject - Copula - Predicate
-        # Example: ⲁⲛⲟⲕ ⲡⲉ ⲡⲛⲟⲩⲧⲉ (I am God)
-        self.prolog.assertz("tripartite_sentence(Subject, Copula, Predicate) :- independent_pronoun(Subject), copula(Copula), noun_compatible(Predicate)")
-
-        # Verbal sentence patterns
-        # Verbal sentence: Conjugation + Subject + Verb
-        self.prolog.assertz("verbal_sentence(Conj, Subject, Verb) :- conjugation_base(Conj), (independent_pronoun(Subject) ; definite_article(Subject)), verb_compatible(Verb)")
-
-        # Helper: Any word can be a verb (simplified)
-        self.prolog.assertz("verb_compatible(_)")
-
-        # ===================================================================
-        # DEPENDENCY VALIDATION RULES
-        # ===================================================================
-
-        # Validate subject-verb relationship
-        self.prolog.assertz("valid_subject_verb(Subject, Verb, SubjPOS, VerbPOS) :- member(SubjPOS, ['PRON', 'NOUN', 'PROPN']), member(VerbPOS, ['VERB', 'AUX'])")
-
-        # Validate determiner-noun relationship
-        self.prolog.assertz("valid_det_noun(Det, Noun, DetPOS, NounPOS) :- DetPOS = 'DET', member(NounPOS, ['NOUN', 'PROPN'])")
-
-        # Validate modifier relationships
-        self.prolog.assertz("valid_modifier(Head, Modifier, ModPOS) :- member(ModPOS, ['ADJ', 'ADV', 'DET'])")
-
-        # Validate punctuation assignments - content words should NOT be punct
-        # Only actual punctuation marks (PUNCT POS tag) should have punct relation
-        self.prolog.assertz("invalid_punct(Word, POS, Relation) :- Relation = 'punct', member(POS, ['VERB', 'NOUN', 'PRON', 'PROPN', 'DET', 'ADJ', 'ADV', 'AUX', 'NUM'])")
-
-        # ===================================================================
-        # ERROR CORRECTION RULES
-        # ===================================================================
-
-        # Suggest correct relation for DET (determiner)
-        # DET before NOUN should be 'det' relation
-        self.prolog.assertz("suggest_correction('DET', _, 'det')")
-
-        # Suggest correct relation for PRON (pronoun)
-        # PRON is typically subject (nsubj), object (obj), or possessive
-        self.prolog.assertz("suggest_correction('PRON', 'VERB', 'nsubj')")  # Pronoun before verb = subject
-        self.prolog.assertz("suggest_correction('PRON', 'AUX', 'nsubj')")   # Pronoun before aux = subject
-        self.prolog.assertz("suggest_correction('PRON', _, 'nsubj')")       # Default for pronoun
-
-        # Suggest correct relation for NOUN
-        self.prolog.assertz("suggest_correction('NOUN', 'VERB', 'obj')")    # Noun after verb = object
-        self.prolog.assertz("suggest_correction('NOUN', 'AUX', 'nsubj')")   # Noun after copula = predicate nominal
-        self.prolog.assertz("suggest_correction('NOUN', _, 'obl')")         # Default for noun
-
-        # Suggest correct relation for VERB
-        # Main verbs are often root, ccomp (complement clause), or advcl (adverbial clause)
-        self.prolog.assertz("suggest_correction('VERB', 'SCONJ', 'ccomp')") # Verb after subordinator = complement
-        self.prolog.assertz("suggest_correction('VERB', 'VERB', 'ccomp')")  # Verb after verb = complement
-        self.prolog.assertz("suggest_correction('VERB', _, 'root')")        # Default for verb
-
-        # Suggest correct relation for AUX (auxiliary/copula)
-        self.prolog.assertz("suggest_correction('AUX', _, 'cop')")          # Copula relation
-
-        # Suggest correct relation for ADJ (adjective)
-        self.prolog.assertz("suggest_correction('ADJ', 'NOUN', 'amod')")    # Adjective modifying noun
-
-        # Suggest correct relation for ADV (adverb)
-        self.prolog.assertz("suggest_correction('ADV', _, 'advmod')")       # Adverbial modifier
-
-        # Suggest correct relation for NUM (number)
-        self.prolog.assertz("suggest_correction('NUM', 'NOUN', 'nummod')") # Number modifying noun
-        self.prolog.assertz("suggest_correction('NUM', _, 'obl')")         # Default for number (temporal/oblique)
-
-        # ===================================================================
-        # MORPHOLOGICAL ANALYSIS RULES
-        # ===================================================================
-
-        # Clitic attachment patterns
-        self.prolog.assertz("has_suffix_pronoun(Word, Base, Suffix) :- atom_concat(Base, Suffix, Word), suffix_pronoun(Suffix), atom_length(Base, BaseLen), BaseLen > 0")
-
-        # Article stripping for lemmatization
-        self.prolog.assertz("strip_article(Word, Lemma) :- definite_article(Article), atom_concat(Article, Lemma, Word), atom_length(Lemma, LemmaLen), LemmaLen > 0")
-
-        # If no article found, word is its own lemma
-        self.prolog.assertz("strip_article(Word, Word) :- \\+ (definite_article(Article), atom_concat(Article, _, Word))")
-
-        print("✓ Coptic grammatical rules loaded into Prolog")
+        """Load Coptic linguistic rules into Prolog (consults coptic_grammar.pl)"""
+        if not GRAMMAR_FILE.is_file():
+            raise FileNotFoundError(f"Coptic grammar not found: {GRAMMAR_FILE}")
+
+        # SWI-Prolog runs as one embedded engine per process: compile the
+        # grammar in a single call, and only for the first engine
+        self._query_first(f"load_files({_atom(GRAMMAR_FILE.as_posix())}, [if(not_loaded)])")
+
+        self._report("✓ Coptic grammatical rules loaded into Prolog")
+
+    def _report(self, message):
+        """Log a startup message, and print it in verbose mode"""
+        logger.info(message)
+        if self.verbose:
+            print(message)
+
+    def _query_all(self, goal):
+        """All solutions of a goal string, as dicts of variable bindings"""
+        if janus is not None:
+            return [{name: value for name, value in answer.items() if name != 'truth'}
+                    for answer in janus.query(goal)]
+        return list(self.prolog.query(goal))
+
+    def _query_first(self, goal):
+        """Bindings of a goal string's first solution, or None; stops the search there"""
+        if janus is not None:
+            answer = janus.query_once(goal)
+            if answer.pop('truth') is not True:
+                return None
+            return answer
+
+        solutions = self.prolog.query(goal)
+        try:
+            return next(solutions, None)
+        finally:
+            solutions.close()  # Closes the Prolog query without backtracking further
+
+    def _pos_pair_holds(self, relation, dep_pos, head_pos):
+        """Whether valid_subject_verb/valid_det_noun accepts a POS pair"""
+        if janus is not None:
+            # janus passes Python str as Prolog strings; the rules match atoms
+            name = 'valid_det_noun' if relation == 'det' else 'valid_subject_verb'
+            answer = janus.query_once(f"atom_string(D, DS), atom_string(H, HS), {name}(_, _, D, H)",
+                                      {'DS': dep_pos, 'HS': head_pos})
+            return answer['truth'] is True
+        # valid_subject_verb/4 and valid_det_noun/4 ignore the word arguments
+        functor = self._valid_det_noun if relation == 'det' else self._valid_subject_verb
+        return self._succeeds(functor, None, None,
+                              self._cached_atom(dep_pos), self._cached_atom(head_pos))
+
+    def _cached_atom(self, text):
+        """pyswip Atom for a string, created once per engine"""
+        atom = self._atom_cache.get(text)
+        if atom is None:
+            atom = self._atom_cache[text] = Atom(text)
+        return atom
 
     # ===================================================================
     # PYTHON INTERFACE METHODS
@@ -195,7 +216,7 @@ class CopticPrologRules:
 
     def validate_dependency(self, head_word, dep_word, head_pos, dep_pos, relation):
         """
-        Validate a dependency relation using Prolog rules
+        Validate a dependency relation using the grammar rules
 
         Args:
             head_word: The head word text
@@ -210,37 +231,37 @@ class CopticPrologRules:
         if not self.prolog_initialized:
             return {"valid": True, "message": "Prolog not available"}
 
-        try:
-            result = {"valid": True, "warnings": [], "suggestions": []}
+        if self._compiled is not None:
+            return self._compiled.validate_dependency(head_word, dep_word, head_pos, dep_pos, relation)
+
+        result = {"valid": True, "warnings": [], "suggestions": []}
+        if relation not in RELEVANT_RELATIONS:
+            return result
 
+        try:
             # Check subject-verb relationships
             if relation in ['nsubj', 'csubj']:
-                query = f"valid_subject_verb('{dep_word}', '{head_word}', '{dep_pos}', '{head_pos}')"
-                query_result = list(self.prolog.query(query))
-                if not query_result:
+                if not self._pos_pair_holds(relation, dep_pos, head_pos):
                     result["warnings"].append(
                         f"Unusual subject-verb: {dep_word} ({dep_pos}) → {head_word} ({head_pos})"
                     )
 
             # Check determiner-noun relationships
             elif relation == 'det':
-                query = f"valid_det_noun('{dep_word}', '{head_word}', '{dep_pos}', '{head_pos}')"
-                query_result = list(self.prolog.query(query))
-                if not query_result:
+                if not self._pos_pair_holds(relation, dep_pos, head_pos):
                     result["warnings"].append(
                         f"Unusual det-noun: {dep_word} → {head_word}"
                     )
 
             # Check for incorrect punctuation assignments and suggest corrections
-            query = f"invalid_punct('{dep_word}', '{dep_pos}', '{relation}')"
-            query_result = list(self.prolog.query(query))
-            if query_result:
+            if self._query_first(f"invalid_punct({_atom(dep_word)}, {_atom(dep_pos)}, {_atom(relation)})") is not None:
                 # Query for suggested correction
-                correction_query = f"suggest_correction('{dep_pos}', '{head_pos}', Suggestion)"
-                correction_result = list(self.prolog.query(correction_query))
+                correction = self._query_first(
+                    f"suggest_correction({_atom(dep_pos)}, {_atom(head_pos)}, Suggestion)"
+                )
+                suggested_rel = _text(correction['Suggestion']) if correction else None
 
-                if correction_result and 'Suggestion' in correction_result[0]:
-                    suggested_rel = correction_result[0]['Suggestion']
+                if suggested_rel is not None:
                     result["warnings"].append(
                         f"⚠️  PARSER ERROR: '{dep_word}' ({dep_pos}) incorrectly labeled as 'punct' → SUGGESTED: '{suggested_rel}'"
                     )
@@ -261,6 +282,24 @@ class CopticPrologRules:
         except Exception as e:
             return {"valid": True, "message": f"Validation error: {e}"}
 
+    @staticmethod
+    def _succeeds(functor, *args):
+        """True if functor(*args) has at least one solution (None args are fresh variables)"""
+        # Term refs live on the calling thread's stack, so attach an engine
+        # for threads that haven't queried yet and build the goal here
+        if PL_thread_self() == -1:
+            PL_thread_attach_engine(None)
+
+        frame = PL_open_foreign_frame()
+        try:
+            query = Query(functor(*[Variable() if arg is None else arg for arg in args]))
+            try:
+                return bool(query.nextSolution())
+            finally:
+                query.closeQuery()
+        finally:
+            PL_discard_foreign_frame(frame)  # Frees the goal's term refs
+
     def check_tripartite_pattern(self, words, pos_tags):
         """
         Check if a sentence follows the Coptic tripartite nominal pattern
@@ -275,23 +314,29 @@ class CopticPrologRules:
         if not self.prolog_initialized or len(words) < 3:
             return {"is_tripartite": False}
 
+        if self._compiled is not None:
+            return self._compiled.check_tripartite_pattern(words, pos_tags)
+
         try:
             # Check for tripartite pattern: Pronoun - Copula - Noun
-            subj, cop, pred = words[0], words[1], words[2]
-
-            query = f"tripartite_sentence('{subj}', '{cop}', '{pred}')"
-            query_result = list(self.prolog.query(query))
-            is_tripartite = len(query_result) > 0
-
-            return {
-                "is_tripartite": is_tripartite,
-                "pattern": f"{subj} - {cop} - {pred}" if is_tripartite else None,
-                "description": "Tripartite nominal sentence" if is_tripartite else None
-            }
+            return dict(self._tripartite_cache(words[0], words[1], words[2]))
 
         except Exception as e:
             return {"is_tripartite": False, "error": str(e)}
 
+    def _query_tripartite(self, subj, cop, pred):
+        if janus is not None:
+            answer = janus.query_once(
+                "atom_string(S, SS), atom_string(C, CS), atom_string(P, PS), tripartite_sentence(S, C, P)",
+                {'SS': subj, 'CS': cop, 'PS': pred}
+            )
+            is_tripartite = answer['truth'] is True
+        else:
+            is_tripartite = self._succeeds(self._tripartite_sentence, self._cached_atom(subj),
+                                           self._cached_atom(cop), self._cached_atom(pred))
+
+        return _tripartite_result(subj, cop, pred, is_tripartite)
+
     def analyze_morphology(self, word):
         """
         Analyze word morphology using Prolog rules
@@ -306,34 +351,32 @@ class CopticPrologRules:
             return {"word": word, "analyzed": False}
 
         try:
-            analysis = {"word": word, "components": []}
-
-            # Check for definite article
-            article_query = f"strip_article('{word}', Lemma)"
-            results = list(self.prolog.query(article_query))
-            if results:
-                result = results[0]
-                if 'Lemma' in result:
-                    lemma = result['Lemma']
-                    if lemma != word:
-                        analysis["has_article"] = True
-                        analysis["lemma"] = lemma
-                        analysis["article"] = word.replace(lemma, '')
-
-            # Check for suffix pronouns
-            suffix_query = f"has_suffix_pronoun('{word}', Base, Suffix)"
-            results = list(self.prolog.query(suffix_query))
-            if results:
-                result = results[0]
-                analysis["has_suffix"] = True
-                analysis["base"] = result.get('Base')
-                analysis["suffix"] = result.get('Suffix')
-
-            return analysis
+            analysis = self._morphology_cache(word)
+            # Copy so callers can't alter the cached analysis
+            return {**analysis, "components": list(analysis["components"])}
 
         except Exception as e:
             return {"word": word, "error": str(e)}
 
+    def _analyze_affixes(self, word):
+        analysis = {"word": word, "components": []}
+
+        article, suffix = _scan_affixes(word)
+
+        # Check for definite article (strip_article/2)
+        if article:
+            analysis["has_article"] = True
+            analysis["lemma"] = word[len(article):]
+            analysis["article"] = article
+
+        # Check for suffix pronouns (has_suffix_pronoun/3)
+        if suffix:
+            analysis["has_suffix"] = True
+            analysis["base"] = word[:-len(suffix)]
+            analysis["suffix"] = suffix
+
+        return analysis
+
     def validate_parse_tree(self, words, pos_tags, heads, deprels):
         """
         Validate an entire parse tree using Prolog constraints
@@ -350,6 +393,9 @@ class CopticPrologRules:
         if not self.prolog_initialized:
             return {"validated": False, "reason": "Prolog not available"}
 
+        if self._compiled is not None:
+            return self._compiled.validate_parse_tree(words, pos_tags, heads, deprels)
+
         try:
             results = {
                 "validated": True,
@@ -358,26 +404,104 @@ class CopticPrologRules:
                 "patterns_found": []
             }
 
+            n = len(words)
+            if n < 2:
+                return results  # No dependency between two words
+
             # Check for tripartite pattern
             tripartite = self.check_tripartite_pattern(words, pos_tags)
             if tripartite.get("is_tripartite"):
                 results["patterns_found"].append(tripartite)
 
-            # Validate each dependency
-            for i, (word, pos, head, rel) in enumerate(zip(words, pos_tags, heads, deprels)):
-                if head > 0 and head <= len(words):  # Not root
-                    head_word = words[head - 1]
-                    head_pos = pos_tags[head - 1]
-
-                    validation = self.validate_dependency(head_word, word, head_pos, pos, rel)
-                    if validation.get("warnings"):
-                        results["warnings"].extend(validation["warnings"])
+            edges = []
+            for word, pos, head, rel in zip(words, pos_tags, heads, deprels):
+                if rel not in RELEVANT_RELATIONS or (pos == 'PUNCT' and rel == 'punct'):
+                    continue  # No rule can fire on this edge
+                if 0 < head <= n:  # Not root
+                    edges.append((word, words[head - 1], pos, pos_tags[head - 1], rel))
+            if not edges:
+                return results
+
+            # Validate every dependency with a single validate_all query
+            terms = ", ".join(
+                f"dep({i}, {_atom(word)}, {_atom(head_word)}, {_atom(pos)}, {_atom(head_pos)}, {_atom(rel)})"
+                for i, (word, head_word, pos, head_pos, rel) in enumerate(edges)
+            )
+            solution = self._query_first(f"validate_all([{terms}], Out)")
+
+            for index, kind, suggestion in solution['Out'] if solution else ():
+                word, head_word, pos, head_pos, rel = edges[int(index)]
+                kind, suggestion = _text(kind), _text(suggestion)
+
+                if kind == 'subject_verb':
+                    results["warnings"].append(
+                        f"Unusual subject-verb: {word} ({pos}) → {head_word} ({head_pos})"
+                    )
+                elif kind == 'det_noun':
+                    results["warnings"].append(
+                        f"Unusual det-noun: {word} → {head_word}"
+                    )
+                elif suggestion != 'none':
+                    results["warnings"].append(
+                        f"⚠️  PARSER ERROR: '{word}' ({pos}) incorrectly labeled as 'punct' → SUGGESTED: '{suggestion}'"
+                    )
+                else:
+                    results["warnings"].append(
+                        f"⚠️  PARSER ERROR: '{word}' ({pos}) incorrectly labeled as 'punct' - should be a content relation"
+                    )
 
             return results
 
         except Exception as e:
             return {"validated": False, "error": str(e)}
 
+    def compile_rules(self):
+        """
+        Materialize the validation rules into Python lookup tables
+
+        The rules used by validate_parse_tree only constrain POS tags and
+        relations, so each one has a small finite set of solutions. They are
+        enumerated once here; the returned object then validates sentences
+        without any further Prolog queries.
+
+        Returns:
+            CompiledCopticRules, or None if Prolog is not available
+        """
+        if not self.prolog_initialized:
+            return None
+
+        def solutions(query):
+            return self._query_all(query)
+
+        subject_verb = {
+            (r['SubjPOS'], r['VerbPOS'])
+            for r in solutions("valid_subject_verb(_, _, SubjPOS, VerbPOS)")
+        }
+        det_noun = {
+            (r['DetPOS'], r['NounPOS'])
+            for r in solutions("valid_det_noun(_, _, DetPOS, NounPOS)")
+        }
+        invalid_punct = {
+            (r['POS'], r['Relation'])
+            for r in solutions("invalid_punct(_, POS, Relation)")
+        }
+
+        # Keep clause order: the first matching clause wins, as in Prolog.
+        # Clauses with an unbound head POS are recorded with the '_' wildcard.
+        suggestions = {}
+        suggestion_query = ("suggest_correction(POS, Head, Suggestion), "
+                            "(var(Head) -> HeadPOS = '_' ; HeadPOS = Head)")
+        for r in solutions(suggestion_query):
+            suggestions.setdefault(r['POS'], []).append((r['HeadPOS'], r['Suggestion']))
+
+        tripartite = {
+            (r['Subject'], r['Copula'])
+            for r in solutions("tripartite_sentence(Subject, Copula, _)")
+        }
+
+        return CompiledCopticRules(subject_verb, det_noun, invalid_punct,
+                                   suggestions, tripartite)
+
     def query_prolog(self, query_string):
         """
         Direct Prolog query interface for custom queries
@@ -392,20 +516,269 @@ class CopticPrologRules:
             return None
 
         try:
-            results = list(self.prolog.query(query_string))
-            return results[0] if results else None
+            return self._query_first(query_string)
         except Exception as e:
-            print(f"Prolog query error: {e}")
+            logger.error("Prolog query error: %s", e)
             return None
 
 
+class CompiledCopticRules:
+    """
+    Pure-Python snapshot of the Prolog validation rules
+
+    Created by CopticPrologRules.compile_rules(). The validation methods
+    return the same structures as their Prolog-backed counterparts.
+    """
+
+    __slots__ = ('subject_verb', 'det_noun', 'invalid_punct', 'suggestions', 'tripartite',
+                 '_subject_verb_keys', '_det_noun_keys', '_invalid_punct_keys',
+                 '_invalid_edges_cache')
+
+    def __init__(self, subject_verb, det_noun, invalid_punct, suggestions, tripartite):
+        """
+        Args:
+            subject_verb: Set of valid (subject POS, verb POS) pairs
+            det_noun: Set of valid (determiner POS, noun POS) pairs
+            invalid_punct: Set of invalid (POS, relation) pairs
+            suggestions: Dict of POS -> [(head POS or '_', suggestion), ...]
+            tripartite: Set of (subject, copula) word pairs
+        """
+        self.subject_verb = frozenset(subject_verb)
+        self.det_noun = frozenset(det_noun)
+        self.invalid_punct = frozenset(invalid_punct)
+        self.suggestions = suggestions
+        self.tripartite = frozenset(tripartite)
+
+        # The pair tables as arrays, for the NumPy masks in _find_invalid_edges
+        self._subject_verb_keys = _pair_keys(self.subject_verb)
+        self._det_noun_keys = _pair_keys(self.det_noun)
+        self._invalid_punct_keys = _pair_keys(self.invalid_punct)
+
+        # Flagged edges depend only on the sentence's POS/head/relation
+        # structure, which recurs across a document
+        self._invalid_edges_cache = lru_cache(maxsize=1024)(self._find_invalid_edges)
+
+    def suggest_correction(self, dep_pos, head_pos):
+        """Return the first suggested relation for a POS pair, or None"""
+        for clause_head_pos, suggestion in self.suggestions.get(dep_pos, ()):
+            if clause_head_pos == '_' or clause_head_pos == head_pos:
+                return suggestion
+        return None
+
+    def validate_dependency(self, head_word, dep_word, head_pos, dep_pos, relation):
+        """Validate a dependency relation (see CopticPrologRules.validate_dependency)"""
+        result = {"valid": True, "warnings": [], "suggestions": []}
+
+        # Check subject-verb relationships
+        if relation in ['nsubj', 'csubj']:
+            if (dep_pos, head_pos) not in self.subject_verb:
+                result["warnings"].append(
+                    f"Unusual subject-verb: {dep_word} ({dep_pos}) → {head_word} ({head_pos})"
+                )
+
+        # Check determiner-noun relationships
+        elif relation == 'det':
+            if (dep_pos, head_pos) not in self.det_noun:
+                result["warnings"].append(
+                    f"Unusual det-noun: {dep_word} → {head_word}"
+                )
+
+        # Check for incorrect punctuation assignments and suggest corrections
+        if (dep_pos, relation) in self.invalid_punct:
+            suggested_rel = self.suggest_correction(dep_pos, head_pos)
+
+            if suggested_rel:
+                result["warnings"].append(
+                    f"⚠️  PARSER ERROR: '{dep_word}' ({dep_pos}) incorrectly labeled as 'punct' → SUGGESTED: '{suggested_rel}'"
+                )
+                result["suggestions"].append({
+                    "word": dep_word,
+                    "pos": dep_pos,
+                    "incorrect": relation,
+                    "suggested": suggested_rel,
+                    "head_pos": head_pos
+                })
+            else:
+                result["warnings"].append(
+                    f"⚠️  PARSER ERROR: '{dep_word}' ({dep_pos}) incorrectly labeled as 'punct' - should be a content relation"
+                )
+
+        return result
+
+    def check_tripartite_pattern(self, words, pos_tags):
+        """Check for the tripartite nominal pattern (see CopticPrologRules.check_tripartite_pattern)"""
+        if len(words) < 3:
+            return {"is_tripartite": False}
+
+        subj, cop, pred = words[0], words[1], words[2]
+        return _tripartite_result(subj, cop, pred, (subj, cop) in self.tripartite)
+
+    def validate_parse_tree(self, words, pos_tags, heads, deprels):
+        """Validate an entire parse tree (see CopticPrologRules.validate_parse_tree)"""
+        results = {
+            "validated": True,
+            "warnings": [],
+            "suggestions": [],
+            "patterns_found": []
+        }
+
+        if len(words) < 2:
+            return results  # No dependency between two words
+
+        # Check for tripartite pattern
+        tripartite = self.check_tripartite_pattern(words, pos_tags)
+        if tripartite.get("is_tripartite"):
+            results["patterns_found"].append(tripartite)
+
+        # Only the flagged dependencies need their warning text built
+        for i in self._invalid_edges(words, pos_tags, heads, deprels):
+            head = heads[i]
+            validation = self.validate_dependency(words[head - 1], words[i], pos_tags[head - 1],
+                                                  pos_tags[i], deprels[i])
+            results["warnings"].extend(validation["warnings"])
+
+        return results
+
+    def _invalid_edges(self, words, pos_tags, heads, deprels):
+        """
+        Indices of the dependencies that break a validation rule
+
+        Evaluates the tables over the whole sentence as NumPy masks.
+        Results are cached per sentence structure.
+        """
+        return self._invalid_edges_cache(len(words), tuple(pos_tags), tuple(heads), tuple(deprels))
+
+    def _find_invalid_edges(self, n_words, pos_tags, heads, deprels):
+        n = min(n_words, len(pos_tags), len(heads), len(deprels))
+        if n == 0:
+            return ()
+
+        pos_arr = np.array(pos_tags[:n], dtype=str)
+        rel_arr = np.array(deprels[:n], dtype=str)
+        heads_arr = np.array(heads[:n], dtype=np.int64)
+
+        has_head = (heads_arr > 0) & (heads_arr <= n_words)  # Not root
+        head_pos = np.array(pos_tags, dtype=str)[np.clip(heads_arr - 1, 0, len(pos_tags) - 1)]
+        pos_pairs = np.char.add(np.char.add(pos_arr, '\t'), head_pos)
+
+        bad_subject = ((rel_arr == 'nsubj') | (rel_arr == 'csubj')) & ~np.isin(pos_pairs, self._subject_verb_keys)
+        bad_det = (rel_arr == 'det') & ~np.isin(pos_pairs, self._det_noun_keys)
+        bad_punct = np.isin(np.char.add(np.char.add(pos_arr, '\t'), rel_arr), self._invalid_punct_keys)
+
+        return tuple(np.flatnonzero(has_head & (bad_subject | bad_det | bad_punct)).tolist())
+
+
+# ===================================================================
+# MORPHOLOGY SCANS
+# ===================================================================
+
+def _scan_affixes(word):
+    """(article, suffix pronoun) found on a word, each '' if absent"""
+    article = next((a for a in COPTIC_ARTICLES
+                    if word.startswith(a) and len(word) > len(a)), '')
+    suffix = next((s for s in COPTIC_SUFFIXES
+                   if word.endswith(s) and len(word) > len(s)), '')
+    return article, suffix
+
+
+def _pack_utf8(strings):
+    """Concatenated UTF-8 bytes of strings and their offsets into the buffer"""
+    encoded = [s.encode('utf-8') for s in strings]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(b) for b in encoded], out=offsets[1:])
+    return np.frombuffer(b''.join(encoded), dtype=np.uint8), offsets
+
+
+# Numba is optional: with it batch_analyze_morphology scans large word
+# lists in compiled code, without it every word goes through _scan_affixes
+try:
+    from numba import njit
+except ImportError:
+    _scan_affixes_batch = None
+else:
+    @njit(cache=True)
+    def _scan_affixes_batch(buf, offsets, art_buf, art_offsets, suf_buf, suf_offsets):
+        """Index of the matching article and suffix for each word, -1 if none"""
+        n_words = offsets.shape[0] - 1
+        found = np.full((n_words, 2), -1, dtype=np.int64)
+        for w in range(n_words):
+            start, end = offsets[w], offsets[w + 1]
+            for a in range(art_offsets.shape[0] - 1):
+                a_start, a_len = art_offsets[a], art_offsets[a + 1] - art_offsets[a]
+                if end - start <= a_len:
+                    continue
+                match = True
+                for k in range(a_len):
+                    if buf[start + k] != art_buf[a_start + k]:
+                        match = False
+                        break
+                if match:
+                    found[w, 0] = a
+                    break
+            for s in range(suf_offsets.shape[0] - 1):
+                s_start, s_len = suf_offsets[s], suf_offsets[s + 1] - suf_offsets[s]
+                if end - start <= s_len:
+                    continue
+                match = True
+                for k in range(s_len):
+                    if buf[end - s_len + k] != suf_buf[s_start + k]:
+                        match = False
+                        break
+                if match:
+                    found[w, 1] = s
+                    break
+        return found
+
+    _ARTICLE_BYTES = _pack_utf8(COPTIC_ARTICLES)
+    _SUFFIX_BYTES = _pack_utf8(COPTIC_SUFFIXES)
+
+
+def batch_analyze_morphology(words):
+    """
+    Article and suffix pronoun lengths for many words at once
+
+    Uses the same rules as CopticPrologRules.analyze_morphology, without
+    Prolog. Large lists are scanned with Numba when it is installed.
+
+    Args:
+        words: List of word forms
+
+    Returns:
+        list: (article length, suffix length) per word, in characters;
+        0 where the word has no article or suffix
+    """
+    if _scan_affixes_batch is None or len(words) <= BATCH_SCAN_MIN_WORDS:
+        return [tuple(map(len, _scan_affixes(word))) for word in words]
+
+    found = _scan_affixes_batch(*_pack_utf8(words), *_ARTICLE_BYTES, *_SUFFIX_BYTES)
+    return [
+        (len(COPTIC_ARTICLES[a]) if a >= 0 else 0,
+         len(COPTIC_SUFFIXES[s]) if s >= 0 else 0)
+        for a, s in found.tolist()
+    ]
+
+
 # ===================================================================
 # CONVENIENCE FUNCTIONS
 # ===================================================================
 
-def create_prolog_engine():
-    """Factory function to create and initialize Prolog engine"""
-    return CopticPrologRules()
+# SWI-Prolog runs as a single embedded engine per process, so engines are shared
+_ENGINES = {}
+_ENGINES_LOCK = threading.Lock()
+
+
+def create_prolog_engine(use_prolog=False, verbose=False):
+    """
+    Factory function to create and initialize Prolog engine
+
+    Returns the process-wide engine for the given use_prolog setting,
+    creating it on the first call.
+    """
+    with _ENGINES_LOCK:
+        engine = _ENGINES.get(use_prolog)
+        if engine is None:
+            engine = _ENGINES[use_prolog] = CopticPrologRules(use_prolog=use_prolog, verbose=verbose)
+        return engine
 
 
 # ===================================================================
@@ -418,7 +791,7 @@ if __name__ == "__main__":
     print("="*70)
 
     # Initialize engine
-    prolog = create_prolog_engine()
+    prolog = create_prolog_engine(verbose=True)
 
     if not prolog.prolog_initialized:
         print("\n⚠️  Prolog not available. Cannot run tests.")